@@ -2,17 +2,27 @@ import sys
 import os
 import time
 import threading
+import functools
+import sqlite3
+import multiprocessing
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QSlider, QLabel, QFileDialog, QFrame, QGraphicsDropShadowEffect,
-    QScrollArea, QListWidget, QListWidgetItem, QSplitter, QMenu, QToolBar, QStatusBar
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QPushButton, QSlider, QLabel, QFileDialog, QFrame,
+    QScrollArea, QListView, QSplitter, QMenu, QToolBar, QStatusBar
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, QUrl, pyqtSignal, QThread, QObject, QAbstractListModel, QModelIndex,
+    QBuffer, QByteArray, QIODevice
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QThread, QObject
 from PyQt6.QtGui import (
-    QPixmap, QFont, QPainter, QPen, QBrush, QColor, QLinearGradient,
-    QAction, QIcon, QImage, QGuiApplication, QCursor
+    QPixmap, QFont, QPainter, QPen, QColor, QLinearGradient,
+    QAction, QIcon, QImage, QImageReader, QPixmapCache, QGuiApplication
 )
 import io
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from pathlib import PurePath
 
 try:
     import vlc
@@ -22,10 +32,19 @@ except ImportError:
     VLC_AVAILABLE = False
     print("VLC not available. Install python-vlc: pip install python-vlc")
 
+# Optional QtMultimedia backend, selected with AUDIOMINE_BACKEND=qt
+try:
+    from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+
+    QTMULTIMEDIA_AVAILABLE = True
+except ImportError:
+    QTMULTIMEDIA_AVAILABLE = False
+
+USE_QT_MULTIMEDIA = QTMULTIMEDIA_AVAILABLE and os.environ.get("AUDIOMINE_BACKEND", "").lower() == "qt"
+
 # Try to import metadata parsing libraries
 try:
     from mutagen import File as MutagenFile
-    from mutagen.id3 import ID3
     from mutagen.mp3 import MP3
     from mutagen.flac import FLAC
     from mutagen.oggvorbis import OggVorbis
@@ -36,33 +55,483 @@ except ImportError:
     MUTAGEN_AVAILABLE = False
     print("Mutagen not available. Install for better metadata: pip install mutagen")
 
+# Optional libtag bindings for faster tag reads; Mutagen still handles cover art
+try:
+    import taglib
 
-class MetadataExtractor(QObject):
-    """Thread-safe metadata extraction for audio files"""
-    metadata_ready = pyqtSignal(dict)
+    TAGLIB_AVAILABLE = True
+except ImportError:
+    TAGLIB_AVAILABLE = False
+
+
+# Application stylesheet, parsed by Qt once per window
+_STYLESHEET = """
+    QMainWindow {
+        background: #121212;
+        color: #ffffff;
+    }
+    QWidget {
+        background-color: transparent;
+        color: #ffffff;
+    }
+    QSplitter {
+        background: #121212;
+    }
+    QSplitter::handle {
+        background: #333333;
+    }
+    QScrollArea, QListView {
+        background-color: #1e1e1e;
+        border-radius: 8px;
+        border: 1px solid #333333;
+        padding: 5px;
+    }
+    QListView::item {
+        color: #e0e0e0;
+        padding: 6px;
+        margin: 2px 0px;
+        border-radius: 4px;
+    }
+    QListView::item:selected {
+        background: #333333;
+        color: #ffffff;
+    }
+    QListView::item:hover {
+        background: #2a2a2a;
+    }
+    QLabel {
+        color: #ffffff;
+        background: transparent;
+    }
+    QLabel#title {
+        font-weight: bold;
+        font-size: 20px;
+        color: #ffffff;
+    }
+    QLabel#subtitle {
+        color: #b3b3b3;
+        font-size: 14px;
+    }
+    QLabel#time {
+        color: #b3b3b3;
+        font-size: 12px;
+    }
+    QLabel#info {
+        color: #b3b3b3;
+        font-size: 12px;
+        font-style: italic;
+    }
+    QPushButton {
+        background-color: #1db954;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1ed760;
+    }
+    QPushButton:pressed {
+        background-color: #1aa34a;
+    }
+    QPushButton#prevButton, QPushButton#playButton, QPushButton#nextButton {
+        background-color: #1db954;
+        border: 1px solid #189a46;
+        padding: 0px;
+        font-family: Arial;
+        font-size: 16pt;
+        font-weight: bold;
+    }
+    QPushButton#prevButton, QPushButton#nextButton {
+        border-radius: 24px;
+    }
+    QPushButton#playButton {
+        border-radius: 32px;
+    }
+    QPushButton#prevButton:hover, QPushButton#playButton:hover, QPushButton#nextButton:hover {
+        background-color: #1ed760;
+        border-color: #19b350;
+    }
+    QPushButton#prevButton:pressed, QPushButton#playButton:pressed, QPushButton#nextButton:pressed {
+        background-color: #1aa34a;
+        border-color: #15883d;
+    }
+    QPushButton#navButton {
+        background-color: #333333;
+        color: #e0e0e0;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-size: 12px;
+        font-weight: normal;
+        text-align: left;
+    }
+    QPushButton#navButton:hover {
+        background-color: #444444;
+        color: white;
+    }
+    QPushButton#openButton {
+        background: transparent;
+        color: #1db954;
+        border: 2px solid #1db954;
+        border-radius: 20px;
+        padding: 8px 24px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#openButton:hover {
+        background: rgba(29, 185, 84, 0.1);
+        color: #1ed760;
+        border-color: #1ed760;
+    }
+    QPushButton#openButton:pressed {
+        background: rgba(29, 185, 84, 0.2);
+        color: #1aa34a;
+        border-color: #1aa34a;
+    }
+    QSlider::groove:horizontal {
+        height: 4px;
+        background: #535353;
+        border-radius: 2px;
+    }
+    QSlider::handle:horizontal {
+        background: #ffffff;
+        border: none;
+        width: 12px;
+        height: 12px;
+        margin: -4px 0;
+        border-radius: 6px;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #1db954;
+        width: 14px;
+        height: 14px;
+        margin: -5px 0;
+        border-radius: 7px;
+    }
+    QSlider::sub-page:horizontal {
+        background: #1db954;
+        border-radius: 2px;
+    }
+
+    /* Volume slider specific styles */
+    QSlider#volumeSlider::groove:horizontal {
+        height: 3px;
+    }
+    QSlider#volumeSlider::handle:horizontal {
+        width: 10px;
+        height: 10px;
+        margin: -3.5px 0;
+    }
+
+    QMenuBar {
+        background-color: #212121;
+        color: white;
+        padding: 2px;
+        border-bottom: 1px solid #333333;
+    }
+    QMenuBar::item {
+        background: transparent;
+        padding: 6px 12px;
+        border-radius: 4px;
+    }
+    QMenuBar::item:selected {
+        background: #333333;
+    }
+    QMenuBar::item:pressed {
+        background: #444444;
+    }
+    QMenu {
+        background-color: #212121;
+        color: white;
+        border: 1px solid #444444;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QMenu::item {
+        padding: 6px 24px 6px 12px;
+        border-radius: 4px;
+    }
+    QMenu::item:selected {
+        background: #333333;
+    }
+
+    QToolBar {
+        background: #212121;
+        border: none;
+        padding: 4px;
+    }
+    QToolBar::separator {
+        background: #444444;
+        width: 1px;
+        height: 20px;
+        margin: 0 8px;
+    }
+    QStatusBar {
+        background: #212121;
+        color: #b3b3b3;
+        border-top: 1px solid #333333;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #2a2a2a;
+        width: 8px;
+        margin: 0px;
+        border-radius: 4px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #606060;
+        min-height: 30px;
+        border-radius: 4px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: #707070;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+# Stylesheet for the album art frame
+_ALBUM_ART_QSS = """
+    #albumArt {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 #353535,
+            stop:1 #252525
+        );
+        border-radius: 10px;
+        border: 1px solid #444444;
+    }
+"""
+
+
+
+# Extensions treated as playable audio when scanning folders
+AUDIO_EXTS = frozenset({'.mp3', '.flac', '.ogg', '.m4a', '.mp4', '.wav', '.aac', '.opus'})
+_AUDIO_SUFFIXES = tuple(AUDIO_EXTS)  # For str.endswith on lowercased names
+
+
+def scan_audio_files(root):
+    """Recursively list (path, stat_result) for audio files under root"""
+    found = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(_AUDIO_SUFFIXES):
+                            found.append((entry.path, entry.stat()))
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f"Error scanning folder: {e}")
+    return found
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_seconds(sec):
+    """Format whole seconds into MM:SS format (memoized; many tracks share lengths)"""
+    minutes, seconds = divmod(sec, 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def _path_stem(path):
+    """File name without its extension, in one backwards scan; cheaper than PurePath per import"""
+    name = path[max(path.rfind('/'), path.rfind(os.sep)) + 1:]
+    dot = name.rfind('.')
+    return name[:dot] if dot > 0 else name
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_font(family, point_size, weight=QFont.Weight.Normal):
+    """Return one QFont instance per face, shared by every widget using it.
+
+    Built lazily because fonts need the QApplication to exist.
+    """
+    return QFont(family, point_size, weight)
+
+
+def _decode_cover(data, size):
+    """Decode cover bytes to a QImage fitted to size x size, or None; safe off the GUI thread"""
+    buffer = QBuffer()
+    buffer.setData(QByteArray(bytes(data)))
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    reader = QImageReader(buffer)
+    # Let the decoder shrink large covers to at most 2x while reading
+    source_size = reader.size()
+    if source_size.width() > size * 2 or source_size.height() > size * 2:
+        reader.setScaledSize(source_size.scaled(size * 2, size * 2, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    buffer.close()
+    if image.isNull():
+        return None
+    return image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation)
+
+
+class MetadataCache:
+    """On-disk SQLite cache of extracted metadata keyed by (path, mtime, size)"""
+
+    _FIELDS = ('title', 'artist', 'album', 'year', 'genre', 'duration', 'cover_art_present')
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(os.path.expanduser("~"), ".cache", "audiomine", "metadata.sqlite")
+        self.lock = threading.Lock()
+        try:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, "
+                "title TEXT, artist TEXT, album TEXT, year TEXT, genre TEXT, duration INTEGER, "
+                "cover_art_present INTEGER)"
+            )
+            # Cover art lives in its own table to keep the main rows small
+            self.conn.execute("CREATE TABLE IF NOT EXISTS covers (path TEXT PRIMARY KEY, data BLOB)")
+            self.conn.commit()
+        except Exception as e:
+            print(f"Metadata cache unavailable: {e}")
+            self.conn = None
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.abort = False
+    def get(self, path, st):
+        """Return cached metadata if the file is unchanged, else None"""
+        if self.conn is None:
+            return None
+        try:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT title, artist, album, year, genre, duration, cover_art_present FROM files "
+                    "WHERE path=? AND mtime=? AND size=?",
+                    (path, st.st_mtime_ns, st.st_size)
+                ).fetchone()
+            if row is None:
+                return None
+            metadata = dict(zip(self._FIELDS, row))
+            metadata['duration'] = metadata['duration'] or 0
+            # NULL means nobody has looked for art yet
+            if metadata['cover_art_present'] is not None:
+                metadata['cover_art_present'] = bool(metadata['cover_art_present'])
+            metadata['cover_art'] = None
+            return metadata
+        except Exception as e:
+            print(f"Metadata cache read error: {e}")
+            return None
+
+    def put(self, path, st, metadata):
+        """Store metadata for a file at its current mtime and size"""
+        if self.conn is None:
+            return
+        try:
+            with self.lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (path, st.st_mtime_ns, st.st_size,
+                     *(metadata.get(field) for field in self._FIELDS))
+                )
+                self.conn.execute("DELETE FROM covers WHERE path=?", (path,))
+                self.conn.commit()
+        except Exception as e:
+            print(f"Metadata cache write error: {e}")
+
+    def get_cover(self, path, st):
+        """Return cached cover bytes if the file is unchanged, else None"""
+        if self.conn is None:
+            return None
+        try:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT covers.data FROM covers JOIN files USING (path) "
+                    "WHERE path=? AND mtime=? AND size=?",
+                    (path, st.st_mtime_ns, st.st_size)
+                ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"Metadata cache read error: {e}")
+            return None
 
-    def extract_metadata(self, file_path):
+    def set_cover_present(self, path, st, present):
+        """Record whether an unchanged file has cover art, keeping the rest of its row"""
+        if self.conn is None:
+            return
+        try:
+            with self.lock:
+                self.conn.execute(
+                    "UPDATE files SET cover_art_present=? WHERE path=? AND mtime=? AND size=?",
+                    (present, path, st.st_mtime_ns, st.st_size)
+                )
+                self.conn.commit()
+        except Exception as e:
+            print(f"Metadata cache write error: {e}")
+
+    def put_cover(self, path, data):
+        """Store cover bytes for a file that already has a metadata row"""
+        if self.conn is None:
+            return
+        try:
+            with self.lock:
+                self.conn.execute("INSERT OR REPLACE INTO covers VALUES (?, ?)", (path, bytes(data)))
+                self.conn.commit()
+        except Exception as e:
+            print(f"Metadata cache write error: {e}")
+
+    def invalidate(self, path):
+        """Forget the cached entry for a file"""
+        if self.conn is None:
+            return
+        try:
+            with self.lock:
+                self.conn.execute("DELETE FROM files WHERE path=?", (path,))
+                self.conn.execute("DELETE FROM covers WHERE path=?", (path,))
+                self.conn.commit()
+        except Exception as e:
+            print(f"Metadata cache delete error: {e}")
+
+    def close(self):
+        """Close the database connection"""
+        if self.conn is not None:
+            with self.lock:
+                self.conn.close()
+                self.conn = None
+
+
+class TagParser:
+    """Reads tags from audio files; free of Qt so it can also run in worker processes"""
+
+    use_taglib = TAGLIB_AVAILABLE
+
+    # Default result shape, copied for every file
+    _BLANK_METADATA = {
+        'title': None,
+        'artist': None,
+        'album': None,
+        'year': None,
+        'genre': None,
+        'duration': 0,
+        'cover_art': None,
+        'cover_art_present': False
+    }
+
+    def _parse_metadata(self, file_path, include_cover=False):
         """Extract metadata from audio files using Mutagen"""
-        metadata = {
-            'title': None,
-            'artist': None,
-            'album': None,
-            'year': None,
-            'genre': None,
-            'duration': 0,
-            'cover_art': None
-        }
+        if self.use_taglib and not include_cover:
+            metadata = self._extract_with_taglib(file_path)
+            if metadata is not None:
+                return metadata
+
+        metadata = self._BLANK_METADATA.copy()
 
         try:
             # Extract basic metadata
             if not MUTAGEN_AVAILABLE:
                 # Basic fallback if mutagen not available
-                filename = os.path.basename(file_path)
-                metadata['title'] = os.path.splitext(filename)[0]
+                metadata['title'] = PurePath(file_path).stem
                 return metadata
 
             # Load the file with mutagen
@@ -70,87 +539,100 @@ class MetadataExtractor(QObject):
             if audio is None:
                 return metadata
 
-            # Try to extract common tags - handle different audio formats
-            if isinstance(audio, MP3):
-                metadata = self._extract_mp3_tags(audio, file_path)
-            elif isinstance(audio, FLAC):
-                metadata = self._extract_flac_tags(audio)
-            elif isinstance(audio, OggVorbis):
-                metadata = self._extract_ogg_tags(audio)
-            elif isinstance(audio, MP4):
-                metadata = self._extract_mp4_tags(audio)
-            else:
-                # Generic tag extraction
-                if hasattr(audio, 'tags') and audio.tags:
-                    for key in ['title', 'artist', 'album', 'date', 'genre']:
-                        if key in audio:
-                            metadata[key] = str(audio[key][0])
+            # Pick the tag reader for this format with a single lookup
+            handler = self._DISPATCH.get(type(audio), TagParser._extract_generic_tags)
+            metadata = handler(self, audio, file_path)
+            self._set_duration(metadata, audio)
 
-            # Get duration if available
-            if hasattr(audio, 'info') and hasattr(audio.info, 'length'):
-                metadata['duration'] = int(audio.info.length * 1000)  # Convert to ms
+            # Only remember that art exists; the bytes are fetched for the playing track
+            metadata['cover_art_present'] = metadata['cover_art'] is not None
+            if not include_cover:
+                metadata['cover_art'] = None
 
         except Exception as e:
             print(f"Metadata extraction error: {e}")
             # Fallback to filename
-            filename = os.path.basename(file_path)
-            metadata['title'] = os.path.splitext(filename)[0]
+            metadata['title'] = PurePath(file_path).stem
+
+        return metadata
+
+    def _extract_with_taglib(self, file_path):
+        """Read tags through libtag; returns None so Mutagen can retry on failure"""
+        try:
+            f = taglib.File(file_path)
+        except Exception as e:
+            print(f"taglib could not read {file_path}: {e}")
+            return None
+
+        try:
+            tags = f.tags
+            metadata = self._BLANK_METADATA.copy()
+            # A tag can be present with an empty value list
+            metadata['title'] = (tags.get('TITLE') or [None])[0]
+            metadata['artist'] = (tags.get('ARTIST') or [None])[0]
+            metadata['album'] = (tags.get('ALBUM') or [None])[0]
+            metadata['year'] = (tags.get('DATE') or [None])[0]
+            metadata['genre'] = (tags.get('GENRE') or [None])[0]
+            metadata['duration'] = int(f.length * 1000)
+            # libtag has no picture API: unknown until the cover lookup finds out
+            metadata['cover_art_present'] = None
+            return metadata
+        except Exception as e:
+            print(f"taglib could not read tags from {file_path}: {e}")
+            return None
+        finally:
+            f.close()
+
+    @staticmethod
+    def _set_duration(metadata, audio):
+        """Fill in the duration in ms from the stream info, if any"""
+        length = getattr(getattr(audio, 'info', None), 'length', None)
+        if length is not None:
+            metadata['duration'] = int(length * 1000)
+
+    def _extract_generic_tags(self, audio, file_path):
+        """Extract common tags from any other Mutagen format"""
+        metadata = self._BLANK_METADATA.copy()
+
+        if hasattr(audio, 'tags') and audio.tags:
+            for key in ['title', 'artist', 'album', 'date', 'genre']:
+                if key in audio:
+                    metadata[key] = str(audio[key][0])
 
         return metadata
 
     def _extract_mp3_tags(self, audio, file_path):
         """Extract tags from MP3 files"""
-        metadata = {
-            'title': None,
-            'artist': None,
-            'album': None,
-            'year': None,
-            'genre': None,
-            'duration': 0,
-            'cover_art': None
-        }
+        metadata = self._BLANK_METADATA.copy()
 
-        try:
-            # Try loading ID3 tags
-            id3 = ID3(file_path)
-
-            # Extract basic tags
-            if 'TIT2' in id3:  # Title
-                metadata['title'] = str(id3['TIT2'])
-            if 'TPE1' in id3:  # Artist
-                metadata['artist'] = str(id3['TPE1'])
-            if 'TALB' in id3:  # Album
-                metadata['album'] = str(id3['TALB'])
-            if 'TDRC' in id3:  # Year
-                metadata['year'] = str(id3['TDRC'])
-            if 'TCON' in id3:  # Genre
-                metadata['genre'] = str(id3['TCON'])
-
-            # Extract album art
-            if 'APIC:' in id3 or 'APIC' in id3:
-                apic_key = 'APIC:' if 'APIC:' in id3 else 'APIC'
-                artwork = id3[apic_key].data
-                metadata['cover_art'] = artwork
-        except:
-            pass
+        # The MP3 object already parsed its ID3 tags
+        id3 = audio.tags
+        if id3 is None:
+            return metadata
 
-        # Get duration
-        if hasattr(audio, 'info') and hasattr(audio.info, 'length'):
-            metadata['duration'] = int(audio.info.length * 1000)  # Convert to ms
+        # Extract basic tags
+        if 'TIT2' in id3:  # Title
+            metadata['title'] = str(id3['TIT2'])
+        if 'TPE1' in id3:  # Artist
+            metadata['artist'] = str(id3['TPE1'])
+        if 'TALB' in id3:  # Album
+            metadata['album'] = str(id3['TALB'])
+        if 'TDRC' in id3:  # Year
+            metadata['year'] = str(id3['TDRC'])
+        if 'TCON' in id3:  # Genre
+            metadata['genre'] = str(id3['TCON'])
+
+        # Extract album art
+        if 'APIC:' in id3 or 'APIC' in id3:
+            apic_key = 'APIC:' if 'APIC:' in id3 else 'APIC'
+            artwork = id3[apic_key].data
+            metadata['cover_art'] = artwork
 
         return metadata
 
-    def _extract_flac_tags(self, audio):
+    def _extract_flac_tags(self, audio, file_path):
         """Extract tags from FLAC files"""
-        metadata = {
-            'title': None,
-            'artist': None,
-            'album': None,
-            'year': None,
-            'genre': None,
-            'duration': 0,
-            'cover_art': None
-        }
+        metadata = self._BLANK_METADATA.copy()
 
         # Extract basic tags
         if 'title' in audio:
@@ -168,23 +650,11 @@ class MetadataExtractor(QObject):
         if audio.pictures:
             metadata['cover_art'] = audio.pictures[0].data
 
-        # Get duration
-        if hasattr(audio, 'info') and hasattr(audio.info, 'length'):
-            metadata['duration'] = int(audio.info.length * 1000)  # Convert to ms
-
         return metadata
 
-    def _extract_ogg_tags(self, audio):
+    def _extract_ogg_tags(self, audio, file_path):
         """Extract tags from OGG files"""
-        metadata = {
-            'title': None,
-            'artist': None,
-            'album': None,
-            'year': None,
-            'genre': None,
-            'duration': 0,
-            'cover_art': None
-        }
+        metadata = self._BLANK_METADATA.copy()
 
         # Extract basic tags
         if 'title' in audio:
@@ -198,23 +668,11 @@ class MetadataExtractor(QObject):
         if 'genre' in audio:
             metadata['genre'] = str(audio['genre'][0])
 
-        # Get duration
-        if hasattr(audio, 'info') and hasattr(audio.info, 'length'):
-            metadata['duration'] = int(audio.info.length * 1000)  # Convert to ms
-
         return metadata
 
-    def _extract_mp4_tags(self, audio):
+    def _extract_mp4_tags(self, audio, file_path):
         """Extract tags from MP4/M4A files"""
-        metadata = {
-            'title': None,
-            'artist': None,
-            'album': None,
-            'year': None,
-            'genre': None,
-            'duration': 0,
-            'cover_art': None
-        }
+        metadata = self._BLANK_METADATA.copy()
 
         # Map of MP4 tags to metadata fields
         mp4_map = {
@@ -234,69 +692,219 @@ class MetadataExtractor(QObject):
         if 'covr' in audio:
             metadata['cover_art'] = audio['covr'][0]
 
-        # Get duration
-        if hasattr(audio, 'info') and hasattr(audio.info, 'length'):
-            metadata['duration'] = int(audio.info.length * 1000)  # Convert to ms
-
         return metadata
 
+    # Mutagen class -> tag reader, resolved once per file with type(audio)
+    _DISPATCH = {
+        MP3: _extract_mp3_tags,
+        FLAC: _extract_flac_tags,
+        OggVorbis: _extract_ogg_tags,
+        MP4: _extract_mp4_tags
+    } if MUTAGEN_AVAILABLE else {}
+
+
+_worker_parser = None  # Per-process TagParser used by _parse_in_worker
+
+
+def _parse_in_worker(file_path, use_taglib):
+    """Process pool entry point: parse one file's tags in a child process"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = TagParser()
+    _worker_parser.use_taglib = use_taglib
+    return _worker_parser._parse_metadata(file_path)
+
+
+class MetadataExtractor(QObject, TagParser):
+    """Thread-safe metadata extraction for audio files"""
+    metadata_ready = pyqtSignal(dict)
+    metadata_batch_ready = pyqtSignal(list)
+
+    # Files handled per pool task when extracting a batch
+    BATCH_CHUNK = 32
+    # A batch worker flushes its results after this many files or seconds
+    EMIT_EVERY = 16
+    EMIT_INTERVAL = 0.05
+    # Results kept in memory in front of the sqlite cache
+    MEMO_SIZE = 4096
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.abort = False
+        self.cache = MetadataCache()
+        self._memo = OrderedDict()  # (path, mtime_ns, size) -> metadata, LRU order
+        self._memo_lock = threading.Lock()
+        self.use_taglib = TAGLIB_AVAILABLE
+        # Shared pool for batch extraction; parsing is mostly blocking file I/O
+        self.executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                           thread_name_prefix="meta")
+        # Single worker for the playing track so it never queues behind a folder import
+        self.priority_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="meta-now")
+        # Batch cache misses are parsed in child processes, past the GIL; workers start on demand.
+        # Spawned rather than forked, since this process already runs Qt and pool threads.
+        self.process_executor = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 1) - 1),
+                                                    mp_context=multiprocessing.get_context("spawn"))
+
+    def extract_metadata(self, file_path, st=None, in_process=False):
+        """Extract metadata, served from the disk cache when the file is unchanged"""
+        # Unknown extensions, or no tag reader at all: the file name is all we can offer
+        if (os.path.splitext(file_path)[1].lower() not in AUDIO_EXTS
+                or not (MUTAGEN_AVAILABLE or self.use_taglib)):
+            return {'title': _path_stem(file_path), 'duration': 0}
+
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return self._parse_metadata(file_path)
+
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        metadata = self._memo_get(key)
+        if metadata is not None:
+            return metadata
+
+        metadata = self.cache.get(file_path, st)
+        if metadata is None:
+            if in_process:
+                metadata = self._parse_out_of_process(file_path)
+                if metadata is None:
+                    return None  # Shutting down
+            else:
+                metadata = self._parse_metadata(file_path)
+            self.cache.put(file_path, st, metadata)
+
+        with self._memo_lock:
+            self._memo[key] = metadata
+            if len(self._memo) > self.MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return metadata.copy()
+
+    def _parse_out_of_process(self, file_path):
+        """Parse on the process pool, blocking this pool thread until the result is back.
+
+        Returns None when the pool was shut down for closing, so nothing more is parsed or cached.
+        """
+        try:
+            return self.process_executor.submit(_parse_in_worker, file_path, self.use_taglib).result()
+        except Exception as e:
+            if self.abort:
+                return None
+            # Broken or shut down pool: parse here instead
+            print(f"Process pool unavailable, parsing {file_path} in-thread: {e}")
+            return self._parse_metadata(file_path)
+
+    def peek(self, file_path):
+        """Return metadata already held in memory for an unchanged file, or None"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return self._memo_get((file_path, st.st_mtime_ns, st.st_size))
+
+    def _memo_get(self, key):
+        # Callers tag the result in place, so only copies leave the memo
+        with self._memo_lock:
+            metadata = self._memo.get(key)
+            if metadata is None:
+                return None
+            self._memo.move_to_end(key)
+            return metadata.copy()
+
+    def invalidate(self, file_path):
+        """Forget everything cached for a file, in memory and on disk"""
+        with self._memo_lock:
+            for key in [k for k in self._memo if k[0] == file_path]:
+                del self._memo[key]
+        self.cache.invalidate(file_path)
+
+    def extract_cover(self, file_path):
+        """Return the embedded cover art bytes for a file, or None"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+
+        data = self.cache.get_cover(file_path, st)
+        if data is not None:
+            return data
+
+        data = self._parse_metadata(file_path, include_cover=True)['cover_art']
+        if data and MUTAGEN_AVAILABLE:
+            self.cache.put_cover(file_path, data)
+        return data
+
+    def record_cover_present(self, file_path, present):
+        """Remember what a cover lookup found, so later plays can skip it"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+        with self._memo_lock:
+            metadata = self._memo.get((file_path, st.st_mtime_ns, st.st_size))
+            if metadata is not None:
+                metadata['cover_art_present'] = present
+        self.cache.set_cover_present(file_path, st, present)
+
     def process_file(self, file_path):
         """Process a file in a separate thread"""
         metadata = self.extract_metadata(file_path)
         self.metadata_ready.emit(metadata)
 
+    def submit_batch(self, jobs):
+        """Queue (file_path, index, stat_result) jobs on the worker pool; results arrive via metadata_batch_ready"""
+        jobs = list(jobs)
+        for start in range(0, len(jobs), self.BATCH_CHUNK):
+            self.executor.submit(self._process_chunk, jobs[start:start + self.BATCH_CHUNK])
+
+    def _process_chunk(self, jobs):
+        """Run a slice of a batch on one pool thread, emitting results in groups"""
+        batch = []
+        last_emit = time.monotonic()
+        for file_path, index, st in jobs:
+            if self.abort:
+                return
+            metadata = self._process_job(file_path, index, st)
+            if metadata is not None:
+                batch.append(metadata)
+
+            # One queued signal per group instead of one per file
+            now = time.monotonic()
+            if batch and (len(batch) >= self.EMIT_EVERY or now - last_emit >= self.EMIT_INTERVAL):
+                self.metadata_batch_ready.emit(batch)
+                batch = []
+                last_emit = now
+        if batch:
+            self.metadata_batch_ready.emit(batch)
+
+    def _process_job(self, file_path, index, st=None):
+        """Extract one file on a pool thread, tagged with its playlist index; None on failure"""
+        try:
+            metadata = self.extract_metadata(file_path, st, in_process=True)
+            if metadata is None:
+                return None
+            metadata['file_path'] = file_path
+            metadata['index'] = index
+            return metadata
+        except Exception as e:
+            print(f"Error extracting metadata: {e}")
+            return None
+
+    def shutdown(self):
+        """Stop the worker pools, dropping jobs that have not started"""
+        self.abort = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.priority_executor.shutdown(wait=False, cancel_futures=True)
+        self.process_executor.shutdown(wait=False, cancel_futures=True)
+
 
 class CircularButton(QPushButton):
-    """Enhanced circular button with hover effects"""
+    """Circular transport button, drawn by Qt from the stylesheet"""
 
     def __init__(self, text="", size=56):
         super().__init__(text)
         self.setFixedSize(size, size)
         self.size = size
-        self.hover = False
-        self.setMouseTracking(True)
-
-    def enterEvent(self, event):
-        self.hover = True
-        self.update()
-        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-
-    def leaveEvent(self, event):
-        self.hover = False
-        self.update()
-        QApplication.restoreOverrideCursor()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Define colors based on state
-        if self.isDown():
-            color = QColor("#1aa34a")  # Pressed color
-        elif self.hover:
-            color = QColor("#1ed760")  # Hover color
-        else:
-            color = QColor("#1db954")  # Normal color
-
-        # Create gradient for more depth
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, color.lighter(110))
-        gradient.setColorAt(1, color)
-
-        # Draw button background
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, self.size - 4, self.size - 4)
-
-        # Add subtle border
-        painter.setPen(QPen(color.darker(120), 1))
-        painter.drawEllipse(2, 2, self.size - 4, self.size - 4)
-
-        # Draw text/icon
-        painter.setPen(QPen(QColor("white")))
-        font = QFont("Arial", 16 if self.size > 40 else 12, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.text())
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
 
 
 class CustomSlider(QSlider):
@@ -307,73 +915,144 @@ class CustomSlider(QSlider):
         self.setMouseTracking(True)
         self.hover = False
         self.hover_position = 0
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+        # Coalesce hover repaints to about one per frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self.update)
 
     def enterEvent(self, event):
         self.hover = True
-        self.update()
-        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self._update_timer.start()
 
     def leaveEvent(self, event):
         self.hover = False
-        self.update()
-        QApplication.restoreOverrideCursor()
+        self._update_timer.start()
 
     def mouseMoveEvent(self, event):
         self.hover_position = event.position().x()
-        self.update()
+        if not self._update_timer.isActive():
+            self._update_timer.start()
         super().mouseMoveEvent(event)
 
 
-class PlaylistItem(QListWidgetItem):
-    """Custom playlist item with metadata"""
-
-    def __init__(self, file_path, title="Unknown Title", artist="Unknown Artist", duration=0):
-        super().__init__()
-        self.file_path = file_path
-        self.title = title
-        self.artist = artist
-        self.duration = duration
+class PlaylistModel(QAbstractListModel):
+    """Playlist rows stored column-wise; display text is built on demand"""
 
-        # Set display text
-        duration_str = self.format_duration(duration)
-        self.setText(f"{title} - {artist} ({duration_str})")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []
+        self._titles = []
+        self._artists = []
+        self._durations = array('i')  # milliseconds
+        self._strings = {}  # one shared copy of each repeated artist/title
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            duration_str = self.format_duration(self._durations[row])
+            return f"{self._titles[row]} - {self._artists[row]} ({duration_str})"
+        return None
+
+    def _shared(self, text):
+        """Return the stored copy of an equal string"""
+        return self._strings.setdefault(text, text)
+
+    def append_track(self, file_path, title="Unknown Title", artist="Unknown Artist", duration=0):
+        """Append a row and return its index"""
+        row = len(self._paths)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._paths.append(file_path)
+        self._titles.append(self._shared(title))
+        self._artists.append(self._shared(artist))
+        self._durations.append(duration)
+        self.endInsertRows()
+        return row
+
+    def append_tracks(self, rows):
+        """Append (file_path, title, artist, duration) rows with a single insert notification"""
+        rows = list(rows)
+        if not rows:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+
+        # Bound methods hoisted out of the per-row loop
+        shared = self._shared
+        add_path = self._paths.append
+        add_title = self._titles.append
+        add_artist = self._artists.append
+        add_duration = self._durations.append
+        for file_path, title, artist, duration in rows:
+            add_path(file_path)
+            add_title(shared(title))
+            add_artist(shared(artist))
+            add_duration(duration)
+        self.endInsertRows()
+
+    def update_track(self, row, title, artist, duration):
+        """Replace the metadata shown for a row"""
+        self._titles[row] = self._shared(title)
+        self._artists[row] = self._shared(artist)
+        self._durations[row] = duration
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def update_tracks(self, rows):
+        """Replace metadata for several (row, title, artist, duration) entries with one dataChanged"""
+        count = len(self._paths)
+        first = last = -1
+        for row, title, artist, duration in rows:
+            if not 0 <= row < count:
+                continue
+            self._titles[row] = self._shared(title)
+            self._artists[row] = self._shared(artist)
+            self._durations[row] = duration
+            first = row if first < 0 else min(first, row)
+            last = max(last, row)
+        if first >= 0:
+            self.dataChanged.emit(self.index(first), self.index(last), [Qt.ItemDataRole.DisplayRole])
+
+    def title(self, row):
+        return self._titles[row]
+
+    def artist(self, row):
+        return self._artists[row]
+
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._paths = []
+        self._titles = []
+        self._artists = []
+        self._durations = array('i')
+        self._strings = {}
+        self.endResetModel()
 
     def format_duration(self, ms):
         """Format milliseconds to MM:SS"""
         if ms <= 0:
             return "0:00"
-
-        seconds = ms // 1000
-        minutes = seconds // 60
-        seconds %= 60
-        return f"{minutes}:{seconds:02d}"
+        return _format_seconds(ms // 1000)
 
 
 class AlbumArtFrame(QFrame):
-    """Custom frame to display album artwork with shadow effect"""
+    """Custom frame to display album artwork"""
 
     def __init__(self, size=280):
         super().__init__()
         self.setFixedSize(size, size)
+        self.art_size = size - 4  # Artwork edge inside the padding; read by worker threads
         self.setObjectName("albumArt")
-        self.setStyleSheet("""
-            #albumArt {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #353535,
-                    stop:1 #252525
-                );
-                border-radius: 10px;
-                border: 1px solid #444444;
-            }
-        """)
-
-        # Apply drop shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 100))
-        shadow.setOffset(0, 5)
-        self.setGraphicsEffect(shadow)
+        self.setStyleSheet(_ALBUM_ART_QSS)
 
         # Create layout for album art
         layout = QVBoxLayout(self)
@@ -384,12 +1063,27 @@ class AlbumArtFrame(QFrame):
         self.art_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.art_label)
 
-        # Set default placeholder image
-        self.set_placeholder_art()
+        # The placeholder is painted after the first show so the window maps sooner
+        self._shown_once = False
+        self._showing_placeholder = False
+
+    def showEvent(self, event):
+        """Fill in the placeholder art once the frame is first shown"""
+        super().showEvent(event)
+        if not self._shown_once:
+            self._shown_once = True
+            QTimer.singleShot(0, self._show_initial_placeholder)
+
+    def _show_initial_placeholder(self):
+        """Set the placeholder unless artwork arrived in the meantime"""
+        pixmap = self.art_label.pixmap()
+        if pixmap is None or pixmap.isNull():
+            self.set_placeholder_art()
 
-    def set_placeholder_art(self):
-        """Create a placeholder for when no album art is available"""
-        size = self.width() - 2  # Account for border
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _build_placeholder_pixmap(size):
+        """Render the placeholder artwork once per size and reuse it"""
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.GlobalColor.transparent)
 
@@ -404,37 +1098,127 @@ class AlbumArtFrame(QFrame):
 
         # Draw music note icon
         painter.setPen(QPen(QColor(180, 180, 180, 200), 2))
-        font = QFont("Arial", 50)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(_shared_font("Arial", 50, QFont.Weight.Bold))
         painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "♪")
         painter.end()
 
-        self.set_artwork(pixmap)
+        return pixmap
+
+    def set_placeholder_art(self):
+        """Create a placeholder for when no album art is available"""
+        if self._showing_placeholder:
+            return
+
+        # Rendered at display size, so it can go straight to the label unscaled
+        size = self.width() - 4  # Account for padding
+        self.art_label.setPixmap(self._build_placeholder_pixmap(size))
+        self._showing_placeholder = True
 
-    def set_artwork(self, pixmap_or_data):
+    def set_artwork(self, pixmap_or_data, cache_key=None):
         """Set the album artwork image from pixmap or raw image data"""
         try:
+            size = self.width() - 4  # Account for padding
+
+            # Scaled covers live in Qt's global pixmap cache, keyed by file path and size
+            pixmap_key = self._pixmap_key(cache_key, size) if cache_key is not None else None
+            if pixmap_key is not None:
+                cached = QPixmapCache.find(pixmap_key)
+                if cached is not None:
+                    self.art_label.setPixmap(cached)
+                    self._showing_placeholder = False
+                    return
+
             if isinstance(pixmap_or_data, QPixmap):
-                pixmap = pixmap_or_data
+                # Scale pixmap to fit the frame while maintaining aspect ratio
+                scaled_pixmap = pixmap_or_data.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                                      Qt.TransformationMode.SmoothTransformation)
             else:
-                # Convert raw image data to pixmap
-                image = QImage()
-                image.loadFromData(pixmap_or_data)
-                pixmap = QPixmap.fromImage(image)
+                # Covers from the extractor arrive already decoded and fitted
+                image = pixmap_or_data
+                if not isinstance(image, QImage):
+                    image = _decode_cover(image, size)
+                    if image is None:
+                        raise ValueError("unreadable cover image")
+                scaled_pixmap = QPixmap.fromImage(image)
 
-            # Scale pixmap to fit the frame while maintaining aspect ratio
-            size = self.width() - 4  # Account for padding
-            scaled_pixmap = pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
-                                          Qt.TransformationMode.SmoothTransformation)
+            if pixmap_key is not None:
+                QPixmapCache.insert(pixmap_key, scaled_pixmap)
 
             self.art_label.setPixmap(scaled_pixmap)
+            self._showing_placeholder = False
         except Exception as e:
             print(f"Error setting artwork: {e}")
             self.set_placeholder_art()
 
+    def show_cached(self, cache_key):
+        """Show a cover already in the pixmap cache; returns False if it is not there"""
+        cached = QPixmapCache.find(self._pixmap_key(cache_key, self.width() - 4))
+        if cached is None:
+            return False
+        self.art_label.setPixmap(cached)
+        self._showing_placeholder = False
+        return True
+
+    def forget_artwork(self, cache_key):
+        """Drop a cached cover so the next set_artwork decodes it again"""
+        QPixmapCache.remove(self._pixmap_key(cache_key, self.width() - 4))
+
+    @staticmethod
+    def _pixmap_key(cache_key, size):
+        return f"cover:{cache_key}:{size}"
+
+
+class ShadowedAlbumArt(QLabel):
+    """Holds an AlbumArtFrame above a drop shadow rendered once into a pixmap"""
+
+    MARGIN = 12
+    OFFSET = 4  # Shadow sits slightly below the art
+
+    def __init__(self, art_frame):
+        super().__init__()
+        size = art_frame.width() + 2 * self.MARGIN
+        self.setFixedSize(size, size)
+        self.setPixmap(self._build_shadow_pixmap(art_frame.width(), self.MARGIN))
+
+        art_frame.setParent(self)
+        art_frame.move(self.MARGIN, self.MARGIN - self.OFFSET)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _build_shadow_pixmap(size, margin):
+        """Paint a soft rounded-rect shadow as stacked translucent layers"""
+        pixmap = QPixmap(size + 2 * margin, size + 2 * margin)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, max(1, 100 // margin)))
+        for spread in range(margin, 0, -1):
+            inset = margin - spread
+            painter.drawRoundedRect(inset, inset, size + 2 * spread, size + 2 * spread,
+                                    10 + spread, 10 + spread)
+        painter.end()
+
+        return pixmap
+
 
 class MusicPlayer(QMainWindow):
+    track_finished = pyqtSignal()
+
+    # UI refresh interval while playing and while paused/stopped
+    PLAYING_TICK_MS = 500
+    IDLE_TICK_MS = 1000
+
+    # Rows beyond each edge of the playlist viewport whose metadata is fetched ahead of scrolling
+    PREFETCH_ROWS = 20
+
+    # VLC states in which the playback position cannot change
+    _IDLE_STATES = (
+        frozenset({vlc.State.Paused, vlc.State.Stopped, vlc.State.NothingSpecial})
+        if VLC_AVAILABLE else frozenset()
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Music Player")
@@ -442,22 +1226,41 @@ class MusicPlayer(QMainWindow):
         self.setMinimumSize(900, 600)
 
         # Setup application font
-        default_font = QFont("Segoe UI", 9)
-        QApplication.setFont(default_font)
+        QApplication.setFont(_shared_font("Segoe UI", 9))
+
+        # Room for decoded cover art in Qt's shared pixmap cache (in KB)
+        QPixmapCache.setCacheLimit(64 * 1024)
 
         # Apply stylesheet
-        self.setStyleSheet(self.get_stylesheet())
+        self.setStyleSheet(_STYLESHEET)
 
         # Setup metadata extractor
         self.metadata_extractor = MetadataExtractor()
         self.metadata_extractor.metadata_ready.connect(self.update_with_metadata)
-
-        # VLC initialization with better error handling
-        self.vlc_available = VLC_AVAILABLE
-        if self.vlc_available:
+        self.metadata_extractor.metadata_batch_ready.connect(self.update_with_metadata_batch)
+
+        # Playback backend: QtMultimedia when requested, VLC otherwise.
+        # vlc_available means "a playback backend is ready" for either one.
+        self.use_qt_backend = USE_QT_MULTIMEDIA
+        self.vlc_available = VLC_AVAILABLE or self.use_qt_backend
+        if self.use_qt_backend:
+            self.media_player = QMediaPlayer(self)
+            self._audio_out = QAudioOutput(self)
+            self.media_player.setAudioOutput(self._audio_out)
+        elif self.vlc_available:
             try:
-                self.vlc_instance = vlc.Instance()
-                self.media_player = self.vlc_instance.media_player_new()
+                try:
+                    # Short prebuffer windows so local files start playing quickly
+                    self.vlc_instance = vlc.Instance([
+                        '--no-xlib', '--quiet', '--intf=dummy',
+                        '--file-caching=300', '--network-caching=300',
+                        '--live-caching=300', '--clock-jitter=0', '--clock-synchro=0'
+                    ])
+                    self.media_player = self.vlc_instance.media_player_new()
+                except Exception as e:
+                    print(f"VLC low-latency init failed, retrying with defaults: {e}")
+                    self.vlc_instance = vlc.Instance()
+                    self.media_player = self.vlc_instance.media_player_new()
             except Exception as e:
                 print(f"VLC init failed: {e}")
                 self.vlc_available = False
@@ -470,6 +1273,13 @@ class MusicPlayer(QMainWindow):
         self.current_track_index = -1
         self.is_playing = False
         self.is_slider_pressed = False
+        self._current_media = None  # VLC Media for the loaded track, released on change
+        self._unextracted = {}  # row -> stat_result (or None) for rows not yet sent for extraction
+
+        # Last values written to the progress widgets, to skip redundant updates
+        self._last_slider_pos = -1
+        self._last_cur_sec = -1
+        self._last_tot_sec = -1
 
         # Create the UI
         self.init_ui()
@@ -481,213 +1291,6 @@ class MusicPlayer(QMainWindow):
         # Set status
         self.statusBar().showMessage("Ready. " + ("VLC available." if self.vlc_available else "VLC not available."))
 
-    def get_stylesheet(self):
-        """Return the application's stylesheet"""
-        return """
-            QMainWindow {
-                background: #121212;
-                color: #ffffff;
-            }
-            QWidget {
-                background-color: transparent;
-                color: #ffffff;
-            }
-            QSplitter {
-                background: #121212;
-            }
-            QSplitter::handle {
-                background: #333333;
-            }
-            QScrollArea, QListWidget {
-                background-color: #1e1e1e;
-                border-radius: 8px;
-                border: 1px solid #333333;
-                padding: 5px;
-            }
-            QListWidget::item {
-                color: #e0e0e0;
-                padding: 6px;
-                margin: 2px 0px;
-                border-radius: 4px;
-            }
-            QListWidget::item:selected {
-                background: #333333;
-                color: #ffffff;
-            }
-            QListWidget::item:hover {
-                background: #2a2a2a;
-            }
-            QLabel {
-                color: #ffffff;
-                background: transparent;
-            }
-            QLabel#title {
-                font-weight: bold;
-                font-size: 20px;
-                color: #ffffff;
-            }
-            QLabel#subtitle {
-                color: #b3b3b3;
-                font-size: 14px;
-            }
-            QLabel#time {
-                color: #b3b3b3;
-                font-size: 12px;
-            }
-            QLabel#info {
-                color: #b3b3b3;
-                font-size: 12px;
-                font-style: italic;
-            }
-            QPushButton {
-                background-color: #1db954;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1ed760;
-            }
-            QPushButton:pressed {
-                background-color: #1aa34a;
-            }
-            QPushButton#navButton {
-                background-color: #333333;
-                color: #e0e0e0;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 12px;
-                font-weight: normal;
-                text-align: left;
-            }
-            QPushButton#navButton:hover {
-                background-color: #444444;
-                color: white;
-            }
-            QPushButton#openButton {
-                background: transparent;
-                color: #1db954;
-                border: 2px solid #1db954;
-                border-radius: 20px;
-                padding: 8px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton#openButton:hover {
-                background: rgba(29, 185, 84, 0.1);
-                color: #1ed760;
-                border-color: #1ed760;
-            }
-            QPushButton#openButton:pressed {
-                background: rgba(29, 185, 84, 0.2);
-                color: #1aa34a;
-                border-color: #1aa34a;
-            }
-            QSlider::groove:horizontal {
-                height: 4px;
-                background: #535353;
-                border-radius: 2px;
-            }
-            QSlider::handle:horizontal {
-                background: #ffffff;
-                border: none;
-                width: 12px;
-                height: 12px;
-                margin: -4px 0;
-                border-radius: 6px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #1db954;
-                width: 14px;
-                height: 14px;
-                margin: -5px 0;
-                border-radius: 7px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #1db954;
-                border-radius: 2px;
-            }
-
-            /* Volume slider specific styles */
-            QSlider#volumeSlider::groove:horizontal {
-                height: 3px;
-            }
-            QSlider#volumeSlider::handle:horizontal {
-                width: 10px;
-                height: 10px;
-                margin: -3.5px 0;
-            }
-
-            QMenuBar {
-                background-color: #212121;
-                color: white;
-                padding: 2px;
-                border-bottom: 1px solid #333333;
-            }
-            QMenuBar::item {
-                background: transparent;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }
-            QMenuBar::item:selected {
-                background: #333333;
-            }
-            QMenuBar::item:pressed {
-                background: #444444;
-            }
-            QMenu {
-                background-color: #212121;
-                color: white;
-                border: 1px solid #444444;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 24px 6px 12px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background: #333333;
-            }
-
-            QToolBar {
-                background: #212121;
-                border: none;
-                padding: 4px;
-            }
-            QToolBar::separator {
-                background: #444444;
-                width: 1px;
-                height: 20px;
-                margin: 0 8px;
-            }
-            QStatusBar {
-                background: #212121;
-                color: #b3b3b3;
-                border-top: 1px solid #333333;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #2a2a2a;
-                width: 8px;
-                margin: 0px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #606060;
-                min-height: 30px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #707070;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """
-
     def init_ui(self):
         """Initialize the user interface"""
         # Set up the menu bar
@@ -699,6 +1302,14 @@ class MusicPlayer(QMainWindow):
         # Create status bar
         self.statusBar()
 
+        # File dialog is built once and reused so it remembers the last directory
+        self._file_dialog = QFileDialog(self, "Select Music Files")
+        self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+        self._file_dialog.setNameFilters([
+            "Audio Files (*.mp3 *.wav *.flac *.ogg *.m4a)",
+            "All Files (*)"
+        ])
+
         # Create main widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -827,9 +1438,24 @@ class MusicPlayer(QMainWindow):
         library_title.setObjectName("title")
 
         # Create playlist widget
-        self.playlist_widget = QListWidget()
+        self.playlist_model = PlaylistModel(self)
+        self.playlist_widget = QListView()
+        self.playlist_widget.setModel(self.playlist_model)
+        self.playlist_widget.setUniformItemSizes(True)
         self.playlist_widget.setAlternatingRowColors(True)
-        self.playlist_widget.itemDoubleClicked.connect(self.playlist_item_clicked)
+        self.playlist_widget.doubleClicked.connect(self.playlist_item_clicked)
+        self.playlist_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.playlist_widget.customContextMenuRequested.connect(self.show_playlist_context_menu)
+
+        # Metadata is extracted as rows come into view; scroll bursts coalesce into one pass
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.setInterval(16)
+        self._viewport_timer.timeout.connect(self._request_visible_metadata)
+        scroll_bar = self.playlist_widget.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._schedule_visible_metadata)
+        scroll_bar.rangeChanged.connect(self._schedule_visible_metadata)
+        self.playlist_model.rowsInserted.connect(self._schedule_visible_metadata)
 
         # Library controls
         library_controls = QHBoxLayout()
@@ -863,11 +1489,11 @@ class MusicPlayer(QMainWindow):
 
         # Album art display
         self.album_art = AlbumArtFrame(280)
-        right_layout.addWidget(self.album_art, 0, Qt.AlignmentFlag.AlignCenter)
+        right_layout.addWidget(ShadowedAlbumArt(self.album_art), 0, Qt.AlignmentFlag.AlignCenter)
 
-        # Track info section
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(8)
+        # Track info, progress slider and time labels share one grid
+        track_grid = QGridLayout()
+        track_grid.setVerticalSpacing(8)
 
         self.song_title_label = QLabel("No song selected")
         self.song_title_label.setObjectName("title")
@@ -878,15 +1504,6 @@ class MusicPlayer(QMainWindow):
         self.artist_album_label.setObjectName("subtitle")
         self.artist_album_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        info_layout.addWidget(self.song_title_label)
-        info_layout.addWidget(self.artist_album_label)
-
-        right_layout.addLayout(info_layout)
-
-        # Progress slider and time
-        progress_layout = QVBoxLayout()
-        progress_layout.setSpacing(8)
-
         self.progress_slider = CustomSlider(Qt.Orientation.Horizontal)
         self.progress_slider.setRange(0, 1000)
         self.progress_slider.sliderMoved.connect(self.set_position)
@@ -894,20 +1511,19 @@ class MusicPlayer(QMainWindow):
         self.progress_slider.sliderReleased.connect(self.slider_released)
         self.progress_slider.setEnabled(self.vlc_available)
 
-        # Time labels
-        time_layout = QHBoxLayout()
         self.current_time_label = QLabel("0:00")
         self.current_time_label.setObjectName("time")
         self.total_time_label = QLabel("0:00")
         self.total_time_label.setObjectName("time")
-        time_layout.addWidget(self.current_time_label)
-        time_layout.addStretch()
-        time_layout.addWidget(self.total_time_label)
 
-        progress_layout.addWidget(self.progress_slider)
-        progress_layout.addLayout(time_layout)
+        track_grid.addWidget(self.song_title_label, 0, 0, 1, 2)
+        track_grid.addWidget(self.artist_album_label, 1, 0, 1, 2)
+        track_grid.setRowMinimumHeight(2, 12)  # Gap between track info and progress
+        track_grid.addWidget(self.progress_slider, 3, 0, 1, 2)
+        track_grid.addWidget(self.current_time_label, 4, 0, Qt.AlignmentFlag.AlignLeft)
+        track_grid.addWidget(self.total_time_label, 4, 1, Qt.AlignmentFlag.AlignRight)
 
-        right_layout.addLayout(progress_layout)
+        right_layout.addLayout(track_grid)
 
         # Playback controls
         controls_layout = QHBoxLayout()
@@ -915,14 +1531,17 @@ class MusicPlayer(QMainWindow):
         controls_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.prev_button = CircularButton("⏮", 48)
+        self.prev_button.setObjectName("prevButton")
         self.prev_button.clicked.connect(self.play_previous)
         self.prev_button.setEnabled(self.vlc_available)
 
         self.play_pause_button = CircularButton("▶", 64)
+        self.play_pause_button.setObjectName("playButton")
         self.play_pause_button.clicked.connect(self.toggle_play_pause)
         self.play_pause_button.setEnabled(self.vlc_available)
 
         self.next_button = CircularButton("⏭", 48)
+        self.next_button.setObjectName("nextButton")
         self.next_button.clicked.connect(self.play_next)
         self.next_button.setEnabled(self.vlc_available)
 
@@ -937,7 +1556,7 @@ class MusicPlayer(QMainWindow):
         volume_layout.setContentsMargins(30, 0, 30, 0)
 
         volume_icon = QLabel("🔊")
-        volume_icon.setFont(QFont("Arial", 16))
+        volume_icon.setFont(_shared_font("Arial", 16))
         volume_icon.setObjectName("subtitle")
 
         self.volume_slider = CustomSlider(Qt.Orientation.Horizontal)
@@ -976,14 +1595,32 @@ class MusicPlayer(QMainWindow):
 
     def setup_media_player(self):
         """Setup the media player and timers"""
-        if self.vlc_available:
+        if self.use_qt_backend:
+            # QMediaPlayer pushes position/duration/status changes, no timer needed
+            self.media_player.positionChanged.connect(self._on_pos)
+            self.media_player.durationChanged.connect(self._on_dur)
+            self.media_player.mediaStatusChanged.connect(self._on_media_status)
+            self._audio_out.setVolume(0.5)
+        elif self.vlc_available:
             try:
-                # Timer for UI updates
+                # Timer for UI updates (labels only show whole seconds)
+                # Bound VLC getters used on every UI tick
+                self._mp_get_length = self.media_player.get_length
+                self._mp_get_time = self.media_player.get_time
+                self._mp_get_state = self.media_player.get_state
+
                 self.timer = QTimer(self)
-                self.timer.setInterval(200)
+                self.timer.setInterval(self.IDLE_TICK_MS)
                 self.timer.timeout.connect(self.update_ui)
                 self.timer.start()
 
+                # Let VLC report the end of a track instead of polling for it.
+                # The callback runs on a VLC thread, so hop back via a signal.
+                self.track_finished.connect(self.play_next)
+                self.media_player.event_manager().event_attach(
+                    vlc.EventType.MediaPlayerEndReached, self._on_end_reached
+                )
+
                 # Set initial volume
                 self.media_player.audio_set_volume(50)
             except Exception as e:
@@ -997,15 +1634,17 @@ class MusicPlayer(QMainWindow):
             return
 
         try:
-            file_paths, _ = QFileDialog.getOpenFileNames(
-                self, "Select Music Files", "",
-                "Audio Files (*.mp3 *.wav *.flac *.ogg *.m4a);;All Files (*)"
-            )
+            file_paths = []
+            if self._file_dialog.exec():
+                file_paths = self._file_dialog.selectedFiles()
+
+            # Drop duplicates within the selection and tracks already queued
+            existing = set(self.playlist)
+            file_paths = [p for p in dict.fromkeys(file_paths) if p not in existing]
 
             if file_paths:
                 # Add files to playlist
-                for file_path in file_paths:
-                    self.add_to_playlist(file_path)
+                self.add_files_to_playlist(file_paths)
 
                 # If this is the first track, start playing
                 if self.current_track_index == -1:
@@ -1029,16 +1668,10 @@ class MusicPlayer(QMainWindow):
             )
 
             if folder_path:
-                # Get all audio files in the folder
-                audio_extensions = ['.mp3', '.wav', '.flac', '.ogg', '.m4a']
-                file_count = 0
-
-                for root, _, files in os.walk(folder_path):
-                    for file in files:
-                        if any(file.lower().endswith(ext) for ext in audio_extensions):
-                            file_path = os.path.join(root, file)
-                            self.add_to_playlist(file_path)
-                            file_count += 1
+                # Get all audio files in the folder; the stats feed the metadata cache key
+                found = scan_audio_files(folder_path)
+                self.add_files_to_playlist([path for path, _ in found], [st for _, st in found])
+                file_count = len(found)
 
                 # If this is the first track, start playing
                 if self.current_track_index == -1 and file_count > 0:
@@ -1050,59 +1683,106 @@ class MusicPlayer(QMainWindow):
             print(f"Error opening folder: {e}")
             self.statusBar().showMessage(f"Error opening folder: {str(e)}")
 
+    def add_files_to_playlist(self, file_paths, stats=None):
+        """Add several files with one model insert; metadata follows as rows come into view"""
+        try:
+            first = len(self.playlist)
+            if stats is None:
+                stats = [None] * len(file_paths)
+            self._unextracted.update(zip(range(first, first + len(file_paths)), stats))
+
+            self.playlist_model.append_tracks(
+                (file_path, _path_stem(file_path), "Loading...", 0) for file_path in file_paths
+            )
+            self.playlist.extend(file_paths)
+        except Exception as e:
+            print(f"Error adding to playlist: {e}")
+
     def add_to_playlist(self, file_path):
         """Add a file to the playlist"""
         try:
             # Extract filename for initial display
-            filename = os.path.basename(file_path)
-            name_without_ext = os.path.splitext(filename)[0]
+            name_without_ext = _path_stem(file_path)
 
-            # Create playlist item with basic info
-            item = PlaylistItem(file_path, name_without_ext, "Loading...", 0)
-            self.playlist_widget.addItem(item)
+            # Create playlist item with basic info; metadata follows once it is visible
+            self._unextracted[len(self.playlist)] = None
+            self.playlist_model.append_track(file_path, name_without_ext, "Loading...", 0)
             self.playlist.append(file_path)
 
-            # Start metadata extraction in a separate thread
-            threading.Thread(
-                target=self.extract_file_metadata,
-                args=(file_path, len(self.playlist) - 1),
-                daemon=True
-            ).start()
-
         except Exception as e:
             print(f"Error adding to playlist: {e}")
 
-    def extract_file_metadata(self, file_path, index):
+    def _schedule_visible_metadata(self, *args):
+        """Coalesce scroll and insert notifications into one viewport pass"""
+        if self._unextracted:
+            self._viewport_timer.start()
+
+    def _request_visible_metadata(self):
+        """Queue extraction for rows in or near the playlist viewport"""
+        if not self._unextracted:
+            return
+        rect = self.playlist_widget.viewport().rect()
+        first = max(0, self.playlist_widget.indexAt(rect.topLeft()).row())
+        last = self.playlist_widget.indexAt(rect.bottomLeft()).row()
+        if last < 0:
+            # The list ends above the bottom edge
+            last = self.playlist_model.rowCount() - 1
+        self._request_metadata(range(max(0, first - self.PREFETCH_ROWS), last + self.PREFETCH_ROWS + 1))
+
+    def _request_metadata(self, rows):
+        """Send the given rows for batch extraction unless they already went"""
+        unextracted = self._unextracted
+        jobs = [(self.playlist[row], row, unextracted.pop(row)) for row in rows if row in unextracted]
+        if jobs:
+            self.metadata_extractor.submit_batch(jobs)
+
+    def extract_file_metadata(self, file_path, index, include_cover=False):
         """Extract metadata for a file in a separate thread"""
         try:
             metadata = self.metadata_extractor.extract_metadata(file_path)
+            # None means not known yet (taglib can't see pictures), so look once
+            known = metadata.get('cover_art_present')
+            if include_cover and known is not False:
+                # Decode and downscale here so the GUI thread only uploads a small image
+                data = self.metadata_extractor.extract_cover(file_path)
+                metadata['cover_art'] = _decode_cover(data, self.album_art.art_size) if data else None
+                metadata['cover_art_present'] = metadata['cover_art'] is not None
+                if metadata['cover_art_present'] != known:
+                    self.metadata_extractor.record_cover_present(file_path, metadata['cover_art_present'])
             metadata['file_path'] = file_path
             metadata['index'] = index
             self.metadata_extractor.metadata_ready.emit(metadata)
         except Exception as e:
             print(f"Error extracting metadata: {e}")
 
+    def update_with_metadata_batch(self, batch):
+        """Apply a group of batch extraction results with one model update"""
+        rows = []
+        for metadata in batch:
+            index = metadata['index']
+            if index == self.current_track_index:
+                # The playing track also refreshes the labels and art
+                self.update_with_metadata(metadata)
+            else:
+                rows.append((index, metadata.get('title') or PurePath(metadata['file_path']).name,
+                             metadata.get('artist') or "Unknown Artist", metadata.get('duration') or 0))
+        self.playlist_model.update_tracks(rows)
+
     def update_with_metadata(self, metadata):
         """Update UI with extracted metadata"""
         try:
             # Extract data from metadata
             file_path = metadata.get('file_path')
             index = metadata.get('index')
-            title = metadata.get('title') or os.path.basename(file_path)
+            title = metadata.get('title') or PurePath(file_path).name
             artist = metadata.get('artist') or "Unknown Artist"
             album = metadata.get('album') or "Unknown Album"
             duration = metadata.get('duration') or 0
             cover_art = metadata.get('cover_art')
 
-            # Update playlist item if index is valid
-            if 0 <= index < self.playlist_widget.count():
-                item = self.playlist_widget.item(index)
-                if isinstance(item, PlaylistItem):
-                    item.title = title
-                    item.artist = artist
-                    item.duration = duration
-                    duration_str = self.format_time(duration)
-                    item.setText(f"{title} - {artist} ({duration_str})")
+            # Update playlist row if index is valid
+            if 0 <= index < self.playlist_model.rowCount():
+                self.playlist_model.update_track(index, title, artist, duration)
 
             # If this is the current track, update UI
             if self.playlist and self.current_track_index >= 0 and index == self.current_track_index:
@@ -1118,18 +1798,43 @@ class MusicPlayer(QMainWindow):
                 self.track_info_label.setText(info_text)
 
                 # Update album art if available
-                if cover_art:
-                    self.album_art.set_artwork(cover_art)
-                else:
+                # Art-less results from list extraction must not clear the loaded cover
+                if cover_art is not None:
+                    self.album_art.set_artwork(cover_art, cache_key=file_path)
+                elif metadata.get('cover_art_present') is False:
                     self.album_art.set_placeholder_art()
 
         except Exception as e:
             print(f"Error updating metadata: {e}")
 
+    def show_playlist_context_menu(self, pos):
+        """Show the context menu for a playlist entry"""
+        index = self.playlist_widget.indexAt(pos)
+        if not index.isValid():
+            return
+
+        menu = QMenu(self)
+        refresh_action = menu.addAction("Refresh metadata")
+        if menu.exec(self.playlist_widget.viewport().mapToGlobal(pos)) == refresh_action:
+            self.refresh_metadata(index.row())
+
+    def refresh_metadata(self, index):
+        """Drop the cached metadata for a playlist entry and extract it again"""
+        if not 0 <= index < len(self.playlist):
+            return
+
+        file_path = self.playlist[index]
+        self.metadata_extractor.invalidate(file_path)
+        self.album_art.forget_artwork(file_path)
+        self.metadata_extractor.executor.submit(
+            self.extract_file_metadata, file_path, index, index == self.current_track_index
+        )
+
     def clear_playlist(self):
         """Clear the playlist"""
-        self.playlist_widget.clear()
+        self.playlist_model.clear()
         self.playlist = []
+        self._unextracted.clear()
         self.current_track_index = -1
 
         # Stop playback if active
@@ -1137,6 +1842,7 @@ class MusicPlayer(QMainWindow):
             self.media_player.stop()
             self.is_playing = False
             self.play_pause_button.setText("▶")
+            self._sync_timer_interval()
 
         # Reset UI
         self.song_title_label.setText("No song selected")
@@ -1146,20 +1852,18 @@ class MusicPlayer(QMainWindow):
         self.current_time_label.setText("0:00")
         self.total_time_label.setText("0:00")
         self.progress_slider.setValue(0)
+        self._last_slider_pos = 0
+        self._last_cur_sec = self._last_tot_sec = 0
 
         self.statusBar().showMessage("Playlist cleared")
 
-    def playlist_item_clicked(self, item):
+    def playlist_item_clicked(self, index):
         """Handle playlist item double-click"""
-        if not isinstance(item, PlaylistItem):
+        if not index.isValid():
             return
 
-        # Find the index of the clicked item
-        for i in range(self.playlist_widget.count()):
-            if self.playlist_widget.item(i) == item:
-                self.current_track_index = i
-                self.load_and_play_current_track()
-                break
+        self.current_track_index = index.row()
+        self.load_and_play_current_track()
 
     def load_and_play_current_track(self):
         """Load and play the current track from the playlist"""
@@ -1168,32 +1872,51 @@ class MusicPlayer(QMainWindow):
 
         try:
             # Highlight the current item in playlist
-            self.playlist_widget.setCurrentRow(self.current_track_index)
+            self.playlist_widget.setCurrentIndex(self.playlist_model.index(self.current_track_index))
 
             # Get the file path
             file_path = self.playlist[self.current_track_index]
 
             # Create a new media and play
-            media = self.vlc_instance.media_new(file_path)
-            self.media_player.set_media(media)
+            if self.use_qt_backend:
+                self.media_player.setSource(QUrl.fromLocalFile(file_path))
+            else:
+                media = self.vlc_instance.media_new(file_path)
+                self.media_player.set_media(media)
+                if self._current_media is not None:
+                    self._current_media.release()
+                self._current_media = media
             self.media_player.play()
             self.is_playing = True
             self.play_pause_button.setText("⏸")
+            self._sync_timer_interval()
+            self._last_cur_sec = self._last_tot_sec = -1
+
+            # Update UI with track info from the playlist row
+            self.song_title_label.setText(self.playlist_model.title(self.current_track_index))
+            self.artist_album_label.setText(self.playlist_model.artist(self.current_track_index))
+
+            # A row that finished loading, with its cover still cached, needs no pool round trip
+            index = self.current_track_index
+            self._unextracted.pop(index, None)  # Handled below, not by the batch pool
+            metadata = None
+            if self.playlist_model.artist(index) != "Loading...":
+                metadata = self.metadata_extractor.peek(file_path)
+            if metadata is not None and (metadata.get('cover_art_present') is False
+                                         or self.album_art.show_cached(file_path)):
+                metadata['file_path'] = file_path
+                metadata['index'] = index
+                self.update_with_metadata(metadata)
+            else:
+                # Load metadata for this file (will update UI when ready)
+                self.metadata_extractor.priority_executor.submit(
+                    self.extract_file_metadata, file_path, index, True
+                )
 
-            # Update UI with track info from playlist item
-            item = self.playlist_widget.item(self.current_track_index)
-            if isinstance(item, PlaylistItem):
-                self.song_title_label.setText(item.title)
-                self.artist_album_label.setText(f"{item.artist}")
-
-            # Load metadata for this file (will update UI when ready)
-            threading.Thread(
-                target=self.extract_file_metadata,
-                args=(file_path, self.current_track_index),
-                daemon=True
-            ).start()
+            # Neighbours are likely next, so have their rows ready
+            self._request_metadata(range(index - 2, index + 3))
 
-            self.statusBar().showMessage(f"Playing: {os.path.basename(file_path)}")
+            self.statusBar().showMessage(f"Playing: {PurePath(file_path).name}")
 
         except Exception as e:
             print(f"Error loading track: {e}")
@@ -1205,7 +1928,9 @@ class MusicPlayer(QMainWindow):
             return
 
         try:
-            if not self.media_player.get_media():
+            has_media = (not self.media_player.source().isEmpty()) if self.use_qt_backend \
+                else self.media_player.get_media()
+            if not has_media:
                 self.open_file()
                 return
 
@@ -1219,9 +1944,15 @@ class MusicPlayer(QMainWindow):
                 self.is_playing = True
                 self.play_pause_button.setText("⏸")
                 self.statusBar().showMessage("Playing")
+            self._sync_timer_interval()
         except Exception as e:
             print(f"Error toggling play/pause: {e}")
 
+    def _sync_timer_interval(self):
+        """Tick the UI timer fast only while something is playing"""
+        if hasattr(self, 'timer'):
+            self.timer.setInterval(self.PLAYING_TICK_MS if self.is_playing else self.IDLE_TICK_MS)
+
     def play_next(self):
         """Play the next track in the playlist"""
         if not self.vlc_available or not self.playlist:
@@ -1251,7 +1982,15 @@ class MusicPlayer(QMainWindow):
     def slider_released(self):
         """Handle when the progress slider is released"""
         self.is_slider_pressed = False
-        self.set_position(self.progress_slider.value())
+        self._last_slider_pos = -1  # The user moved the handle; resync on next tick
+        position = self.progress_slider.value()
+        self.set_position(position)
+
+        # update_ui skips idle ticks, so show the new time now when seeking while paused
+        if self.vlc_available and not self.use_qt_backend and self._mp_get_state() in self._IDLE_STATES:
+            media_length = self._mp_get_length()
+            if media_length > 0:
+                self._update_progress(int(position / 1000.0 * media_length), media_length)
 
     def set_position(self, position):
         """Set the playback position based on slider value"""
@@ -1259,7 +1998,10 @@ class MusicPlayer(QMainWindow):
             return
 
         try:
-            if self.media_player.is_seekable():
+            if self.use_qt_backend:
+                if self.media_player.isSeekable():
+                    self.media_player.setPosition(int(position / 1000.0 * self.media_player.duration()))
+            elif self.media_player.is_seekable():
                 self.media_player.set_position(position / 1000.0)
         except Exception as e:
             print(f"Error setting position: {e}")
@@ -1270,50 +2012,72 @@ class MusicPlayer(QMainWindow):
             return
 
         try:
-            self.media_player.audio_set_volume(volume)
+            if self.use_qt_backend:
+                self._audio_out.setVolume(volume / 100.0)
+            else:
+                self.media_player.audio_set_volume(volume)
             self.volume_label.setText(f"{volume}%")
         except Exception as e:
             print(f"Error setting volume: {e}")
 
     def format_time(self, ms):
         """Format milliseconds into MM:SS format"""
-        if ms <= 0:
-            return "0:00"
-
         try:
-            seconds = ms // 1000
-            minutes = seconds // 60
-            seconds %= 60
-            return f"{minutes}:{seconds:02d}"
+            return _format_seconds(max(0, int(ms) // 1000))
         except:
             return "0:00"
 
     def update_ui(self):
         """Update UI elements based on player state"""
-        if not self.vlc_available:
+        if not self.vlc_available or self.is_slider_pressed:
             return
 
-        try:
-            if not self.is_slider_pressed:
-                # Update progress slider and time labels
-                try:
-                    media_length = self.media_player.get_length()
-                    current_time = self.media_player.get_time()
-
-                    if media_length > 0:
-                        position = int((current_time / media_length) * 1000)
-                        self.progress_slider.setValue(position)
-                        self.current_time_label.setText(self.format_time(current_time))
-                        self.total_time_label.setText(self.format_time(media_length))
-                except:
-                    pass
-
-            # Check for end of track
-            if self.media_player.get_state() == vlc.State.Ended:
-                self.play_next()
-        except Exception as e:
-            # Silent handling of UI update errors
-            pass
+        # One state query is enough while nothing is advancing
+        if self._mp_get_state() in self._IDLE_STATES:
+            return
+
+        # Update progress slider and time labels; VLC reports -1 when there is no length yet,
+        # which _update_progress skips. End of track arrives through the EndReached event.
+        self._update_progress(self._mp_get_time(), self._mp_get_length())
+
+    def _update_progress(self, current_time, media_length):
+        """Write slider position and time labels for the given times in ms"""
+        if media_length > 0:
+            # Only touch widgets whose displayed value actually changed
+            position = int((current_time / media_length) * 1000)
+            if position != self._last_slider_pos:
+                self._last_slider_pos = position
+                self.progress_slider.setValue(position)
+
+            # Labels show whole seconds, so compare before formatting
+            cur_sec = current_time // 1000
+            if cur_sec != self._last_cur_sec:
+                self._last_cur_sec = cur_sec
+                self.current_time_label.setText(self.format_time(current_time))
+
+            tot_sec = media_length // 1000
+            if tot_sec != self._last_tot_sec:
+                self._last_tot_sec = tot_sec
+                self.total_time_label.setText(self.format_time(media_length))
+
+    def _on_pos(self, position):
+        """QMediaPlayer position update"""
+        if not self.is_slider_pressed:
+            self._update_progress(position, self.media_player.duration())
+
+    def _on_dur(self, duration):
+        """QMediaPlayer duration update"""
+        if not self.is_slider_pressed:
+            self._update_progress(self.media_player.position(), duration)
+
+    def _on_media_status(self, status):
+        """QMediaPlayer status update; advance when a track ends"""
+        if status == QMediaPlayer.MediaStatus.EndOfMedia:
+            self.play_next()
+
+    def _on_end_reached(self, event):
+        """VLC callback for the end of the current track"""
+        self.track_finished.emit()
 
     def show_about(self):
         """Show the about dialog"""
@@ -1326,15 +2090,22 @@ class MusicPlayer(QMainWindow):
             try:
                 if self.media_player:
                     self.media_player.stop()
-                    self.media_player.release()
+                    if not self.use_qt_backend:
+                        self.media_player.release()
+                if self._current_media is not None:
+                    self._current_media.release()
+                    self._current_media = None
                 if hasattr(self, 'timer'):
                     self.timer.stop()
             except:
                 pass
+        self.metadata_extractor.shutdown()
+        self.metadata_extractor.cache.close()
         super().closeEvent(event)
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
 
@@ -1,45 +1,113 @@
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtCore import QObject, pyqtSignal, QThread, QRunnable, QThreadPool, QMetaObject, Qt, Q_ARG
 
+# orjson encodes/decodes in C; fall back to the standard library when missing
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ScannerWorker(QRunnable):
     """Worker thread for scanning the music library"""
 
     class Signals(QObject):
         progress = pyqtSignal(int, int)  # files_found, total_scanned
-        finished = pyqtSignal(list)  # list of found files
+        finished = pyqtSignal(list, dict)  # list of found files, {path: stat_result}
 
     def __init__(self, directory, supported_extensions):
         super().__init__()
         self.directory = directory
-        self.supported_extensions = supported_extensions
+        self.supported_extensions = tuple(supported_extensions)  # Lowercase suffixes for str.endswith
         self.signals = self.Signals()
         self.abort = False
 
+    # Progress is reported at most every this many matches or seconds
+    PROGRESS_EVERY_FILES = 128
+    PROGRESS_EVERY_SECONDS = 0.1
+
     def run(self):
         files_found = []
+        file_stats = {}
         files_scanned = 0
+        last_emit_count = 0
+        last_emit_time = time.monotonic()
 
         try:
-            for root, dirs, files in os.walk(self.directory):
-                if self.abort:
-                    break
+            # Explicit scandir traversal: entries carry their full path and cached type
+            stack = [self.directory]
+            while stack and not self.abort:
+                try:
+                    entries = os.scandir(stack.pop())
+                except OSError:
+                    continue
+
+                with entries:
+                    for entry in entries:
+                        if self.abort:
+                            break
+
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                        except OSError:
+                            continue
+
+                        files_scanned += 1
+
+                        if entry.name.lower().endswith(self.supported_extensions):
+                            files_found.append(entry.path)
+                            # Kept for metadata extraction; the entry may already hold it
+                            try:
+                                file_stats[entry.path] = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                pass
+
+                            # Coalesce progress updates instead of signalling per file
+                            now = time.monotonic()
+                            if (len(files_found) - last_emit_count >= self.PROGRESS_EVERY_FILES
+                                    or now - last_emit_time > self.PROGRESS_EVERY_SECONDS):
+                                self.signals.progress.emit(len(files_found), files_scanned)
+                                last_emit_count = len(files_found)
+                                last_emit_time = now
+
+            # Final update so the reported totals are exact
+            self.signals.progress.emit(len(files_found), files_scanned)
+            self.signals.finished.emit(files_found, file_stats)
+        except Exception as e:
+            print(f"Error in scanner thread: {e}")
+            self.signals.finished.emit([], {})
 
-                for file in files:
-                    files_scanned += 1
 
-                    if self.abort:
-                        break
+def find_missing(paths):
+    """Return the paths that no longer exist, checked in parallel since each is a blocking stat"""
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        exists = list(executor.map(os.path.exists, paths))
+    return [p for p, ok in zip(paths, exists) if not ok]
 
-                    if any(file.lower().endswith(ext) for ext in self.supported_extensions):
-                        full_path = os.path.join(root, file)
-                        files_found.append(full_path)
-                        self.signals.progress.emit(len(files_found), files_scanned)
 
-            self.signals.finished.emit(files_found)
+class MissingFilesWorker(QRunnable):
+    """Worker thread for checking which library files are gone"""
+
+    class Signals(QObject):
+        finished = pyqtSignal(list)  # paths that no longer exist
+
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(find_missing(self.paths))
         except Exception as e:
-            print(f"Error in scanner thread: {e}")
+            print(f"Error checking library files: {e}")
             self.signals.finished.emit([])
 
 
@@ -55,9 +123,14 @@ class LibraryManager(QObject):
     def __init__(self):
         super().__init__()
         self.library = []
+        self._library_set = set()  # Mirrors self.library for O(1) membership checks
         self.supported_extensions = ['.mp3', '.flac', '.wav', '.ogg', '.m4a']
+        self.supported_extensions_tuple = tuple(self.supported_extensions)
         self.current_scanner = None
-        self.thread_pool = QThreadPool()
+        self._scan_stats = {}  # path -> stat_result from the last scan, until taken
+        # Share Qt's global pool (sized once in main) with metadata extraction
+        # instead of competing for cores
+        self.thread_pool = QThreadPool.globalInstance()
 
     def scan_directory(self, directory_path):
         """Start scanning a directory for music files"""
@@ -67,7 +140,7 @@ class LibraryManager(QObject):
         self.scanStarted.emit()
 
         # Create scanner worker
-        scanner = ScannerWorker(directory_path, self.supported_extensions)
+        scanner = ScannerWorker(directory_path, self.supported_extensions_tuple)
         scanner.signals.progress.connect(self._on_scan_progress)
         scanner.signals.finished.connect(self._on_scan_finished)
 
@@ -87,16 +160,31 @@ class LibraryManager(QObject):
         """Handle progress updates from scanner"""
         self.scanProgress.emit(files_found, total_scanned)
 
-    def _on_scan_finished(self, files):
+    def _on_scan_finished(self, files, file_stats):
         """Handle scan completion"""
+        self._scan_stats.update(file_stats)
+
         # Add only new files to library
-        new_files = [f for f in files if f not in self.library]
+        new_files = self.add_files(files)
+        self.scanFinished.emit(len(new_files))
+        self.current_scanner = None
+
+    def add_files(self, files):
+        """Add files not already in the library; returns the ones added"""
+        new_files = []
+        for f in files:
+            if f not in self._library_set:
+                self._library_set.add(f)
+                new_files.append(f)
         if new_files:
             self.library.extend(new_files)
             self.libraryUpdated.emit()
+        return new_files
 
-        self.scanFinished.emit(len(new_files))
-        self.current_scanner = None
+    def take_scan_stats(self):
+        """Return stat results gathered by scans since the last call, then forget them"""
+        stats, self._scan_stats = self._scan_stats, {}
+        return stats
 
     def get_library(self):
         """Get the current library file list"""
@@ -105,12 +193,28 @@ class LibraryManager(QObject):
     def clear_library(self):
         """Clear the entire library"""
         self.library = []
+        self._library_set = set()
         self.libraryUpdated.emit()
 
     def remove_missing_files(self):
         """Remove files that no longer exist"""
+        return self._drop_files(find_missing(self.library))
+
+    def remove_missing_files_async(self):
+        """Check for missing files on the thread pool and drop them when the check completes"""
+        worker = MissingFilesWorker(list(self.library))
+        worker.signals.finished.connect(self._drop_files)
+        self._missing_worker = worker  # Keep the signals object alive until it reports
+        self.thread_pool.start(worker)
+
+    def _drop_files(self, missing):
+        """Remove the given paths from the library; returns how many were removed"""
+        if not missing:
+            return 0
+        missing = set(missing)
         original_count = len(self.library)
-        self.library = [f for f in self.library if os.path.exists(f)]
+        self.library = [f for f in self.library if f not in missing]
+        self._library_set = set(self.library)
         if len(self.library) != original_count:
             self.libraryUpdated.emit()
         return original_count - len(self.library)
@@ -118,8 +222,16 @@ class LibraryManager(QObject):
     def save_library(self, filepath="music_library.json"):
         """Save the music library to a JSON file"""
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.library, f)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self.library)
+            else:
+                data = json.dumps(self.library).encode('utf-8')
+
+            # Write to a temp file and swap it in so a crash can't truncate the library
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, filepath)
             return True
         except Exception as e:
             print(f"Error saving library: {e}")
@@ -129,9 +241,11 @@ class LibraryManager(QObject):
         """Load the music library from a JSON file"""
         try:
             if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    self.library = json.load(f)
-                self.remove_missing_files()  # Clean up any missing files
+                with open(filepath, 'rb') as f:
+                    data = f.read()
+                self.library = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                self._library_set = set(self.library)
+                self.remove_missing_files_async()  # Clean up missing files off the GUI thread
                 self.libraryUpdated.emit()
                 return len(self.library)
         except Exception as e:
@@ -1,21 +1,28 @@
 import os
+import re
+import sys
+import time
+import hashlib
+import functools
+import importlib
+import pickle
+import sqlite3
 import logging
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("MetadataHandler")
 
-# Try to import audio metadata libraries with fallbacks
+# Try to import audio metadata libraries with fallbacks.
+# Only the package is imported here; each format module loads the first time it is needed
 try:
-    from mutagen import File
-    from mutagen.id3 import ID3
-    from mutagen.mp3 import MP3
-    from mutagen.flac import FLAC
-    from mutagen.mp4 import MP4
-    from mutagen.oggvorbis import OggVorbis
-    from mutagen.wavpack import WavPack
+    import mutagen
 
     MUTAGEN_AVAILABLE = True
     logger.info("Mutagen library loaded successfully")
@@ -24,13 +31,365 @@ except ImportError:
     logger.warning("Mutagen not available. Install with: pip install mutagen")
 
 
+@functools.lru_cache(maxsize=None)
+def _mutagen_class(module_name, class_name):
+    """Import a mutagen format class on first use"""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class LRUCache:
+    """Thread-safe LRU mapping bounded by entry count, and optionally by total cost and age"""
+
+    def __init__(self, maxsize, max_cost=None, cost=None, ttl=None):
+        self.maxsize = maxsize
+        self.max_cost = max_cost
+        self.cost = cost  # value -> cost, e.g. bytes held
+        self.ttl = ttl  # seconds an entry stays valid
+        self._data = OrderedDict()  # key -> (value, cost, expiry)
+        self._total_cost = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[2] is not None and entry[2] < time.monotonic():
+                self._remove(key)
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def __setitem__(self, key, value):
+        cost = self.cost(value) if self.cost else 0
+        expiry = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, cost, expiry)
+            self._total_cost += cost
+
+            # Evict least recently used entries until back within both limits
+            while self._data and (len(self._data) > self.maxsize
+                                  or (self.max_cost is not None and self._total_cost > self.max_cost)):
+                self._total_cost -= self._data.popitem(last=False)[1][1]
+
+    def __len__(self):
+        return len(self._data)
+
+    def _remove(self, key):
+        self._total_cost -= self._data.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._total_cost = 0
+
+
+class MetadataStore:
+    """SQLite memo of extracted metadata that survives restarts, keyed by path|size|mtime"""
+
+    # Writes are buffered and committed together in groups of this size
+    FLUSH_EVERY = 64
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(os.path.expanduser("~"), ".cache", "audiomine", "meta.sqlite")
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self._pending = []
+        # Opened on first use, so handlers that only parse (pool workers) never touch the file
+        self.conn = None
+        self._opened = False
+
+    def _connect_locked(self):
+        """Open the database once; returns the connection, or None if unavailable"""
+        if not self._opened:
+            self._opened = True
+            try:
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+                self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, blob BLOB)")
+                self.conn.commit()
+            except Exception as e:
+                logger.warning(f"Metadata store unavailable: {e}")
+                self.conn = None
+        return self.conn
+
+    @staticmethod
+    def key(file_path, st):
+        """Build the store key for a file from its stat result"""
+        return f"{file_path}|{st.st_size}|{st.st_mtime_ns}"
+
+    def get(self, key):
+        """Return stored metadata for a key, or None"""
+        try:
+            with self.lock:
+                if self._connect_locked() is None:
+                    return None
+                row = self.conn.execute("SELECT blob FROM meta WHERE key=?", (key,)).fetchone()
+            return pickle.loads(row[0]) if row else None
+        except Exception as e:
+            logger.error(f"Metadata store read error: {e}")
+            return None
+
+    def put(self, key, metadata):
+        """Queue metadata for storage; written once enough entries have gathered"""
+        with self.lock:
+            if self._connect_locked() is None:
+                return
+            self._pending.append((key, pickle.dumps(metadata, pickle.HIGHEST_PROTOCOL)))
+            if len(self._pending) >= self.FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self):
+        """Write any queued entries"""
+        with self.lock:
+            if self.conn is not None:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        try:
+            self.conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", self._pending)
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"Metadata store write error: {e}")
+        self._pending = []
+
+    def close(self):
+        """Flush queued entries and close the database"""
+        with self.lock:
+            self._opened = True  # Don't reopen after close
+            if self.conn is None:
+                return
+            self._flush_locked()
+            self.conn.close()
+            self.conn = None
+
+
+def _image_bytes(image):
+    """Approximate memory held by a QImage or QPixmap"""
+    return image.width() * image.height() * 4
+
+
+def _pixmap_bytes(entry):
+    """Approximate memory held by an art cache entry of (pixmap, mtime)"""
+    return _image_bytes(entry[0])
+
+
+def format_columns(lengths, bitrates, sizes):
+    """Format length, bitrate and file size columns for many tracks at once.
+
+    Returns (length_formatted, bitrate_formatted, file_size_formatted) lists matching
+    the strings MetadataHandler produces for a single track.
+    """
+    import numpy as np  # Only bulk extraction needs it, so workers don't pay the import
+
+    lengths = np.asarray(lengths, dtype=float)
+    bitrates = np.asarray(bitrates, dtype=np.int64)
+    sizes = np.asarray(sizes, dtype=np.int64)
+
+    mins, secs = np.divmod(lengths.astype(np.int64), 60)
+    length_strs = [f"{m}:{s:02d}" if ok else "0:00"
+                   for m, s, ok in zip(mins.tolist(), secs.tolist(), (lengths > 0).tolist())]
+
+    kbps = bitrates // 1000
+    bitrate_strs = [f"{k} kbps" if ok else "Unknown"
+                    for k, ok in zip(kbps.tolist(), (bitrates > 0).tolist())]
+
+    # Bucket sizes by unit with masks, then scale each bucket by its divisor
+    unit_idx = np.zeros(len(sizes), dtype=np.int64)  # 0 KB, 1 MB, 2 GB
+    unit_idx[sizes >= 1 << 20] = 1
+    unit_idx[sizes >= 1 << 30] = 2
+    scaled = sizes / np.array([1 << 10, 1 << 20, 1 << 30])[unit_idx]
+    units = ('KB', 'MB', 'GB')
+    size_strs = [f"{v:.2f} {units[u]}" if ok else MetadataHandler._ZERO_SIZE
+                 for v, u, ok in zip(scaled.tolist(), unit_idx.tolist(), (sizes > 0).tolist())]
+
+    return length_strs, bitrate_strs, size_strs
+
+
+_worker_handler = None  # Per-process MetadataHandler used by _extract_in_worker
+
+
+def _extract_in_worker(file_path, st=None):
+    """Process pool entry point: parse one file's tags, or None if it can't be read"""
+    global _worker_handler
+    if _worker_handler is None:
+        _worker_handler = MetadataHandler()
+    return _worker_handler._parse_for_bulk(file_path, st)
+
+
+class MetadataWorker(QRunnable):
+    """Worker thread for extracting metadata off the GUI thread"""
+
+    class Signals(QObject):
+        finished = pyqtSignal(str, dict)  # file_path, metadata
+
+    def __init__(self, metadata_handler, file_path):
+        super().__init__()
+        self.metadata_handler = metadata_handler
+        self.file_path = file_path
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            metadata = self.metadata_handler.extract_metadata(self.file_path)
+        except Exception as e:
+            logger.error(f"Error in metadata worker for {self.file_path}: {e}")
+            metadata = self.metadata_handler._create_basic_metadata(self.file_path)
+        self.signals.finished.emit(self.file_path, metadata)
+
+
+class BulkMetadataWorker(QRunnable):
+    """Worker thread running extract_metadata_bulk off the GUI thread"""
+
+    class Signals(QObject):
+        finished = pyqtSignal(dict)  # {file_path: metadata}
+
+    def __init__(self, metadata_handler, file_paths, stats=None):
+        super().__init__()
+        self.metadata_handler = metadata_handler
+        self.file_paths = file_paths
+        self.stats = stats
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            results = self.metadata_handler.extract_metadata_bulk(self.file_paths, stats=self.stats)
+        except Exception as e:
+            logger.error(f"Error in bulk metadata worker: {e}")
+            results = {path: self.metadata_handler._create_basic_metadata(path) for path in self.file_paths}
+        self.signals.finished.emit(results)
+
+
+class AlbumArtWorker(QRunnable):
+    """Worker thread for reading and decoding album art off the GUI thread"""
+
+    class Signals(QObject):
+        finished = pyqtSignal(str, object, float)  # file_path, QImage or None, mtime
+
+    def __init__(self, metadata_handler, file_path):
+        super().__init__()
+        self.metadata_handler = metadata_handler
+        self.file_path = file_path
+        self.signals = self.Signals()
+
+    def run(self):
+        image = None
+        file_mtime = 0.0
+        try:
+            file_mtime = os.path.getmtime(self.file_path)
+            image = self.metadata_handler._read_album_image(self.file_path)
+        except Exception as e:
+            logger.error(f"Error in album art worker for {self.file_path}: {e}")
+        self.signals.finished.emit(self.file_path, image, file_mtime)
+
+
 class MetadataHandler:
     """Enhanced handler for audio file metadata extraction"""
 
-    def __init__(self):
-        self.cache = {}  # Cache metadata to avoid re-reading files
-        self.art_cache = {}  # Cache album art separately
-        self.supported_extensions = ['.mp3', '.flac', '.wav', '.ogg', '.m4a', '.aac', '.wma', '.ape']
+    # Formats whose tags can carry embedded artwork
+    ART_EXTENSIONS = frozenset({'.mp3', '.flac', '.m4a', '.mp4', '.aac', '.ogg'})
+
+    # Tag key -> metadata field per format, built once at import
+    _ID3_MAP = {
+        'TIT2': 'title',
+        'TPE1': 'artist',
+        'TPE2': 'album_artist',
+        'TALB': 'album',
+        'TCON': 'genre',
+        'TDRC': 'year',
+        'TYER': 'year',
+        'TRCK': 'track',
+        'TPOS': 'disc',
+        'TCOM': 'composer',
+        'COMM': 'comment'
+    }
+
+    _FLAC_MAP = {
+        'title': 'title',
+        'artist': 'artist',
+        'album': 'album',
+        'albumartist': 'album_artist',
+        'genre': 'genre',
+        'date': 'year',
+        'tracknumber': 'track',
+        'composer': 'composer',
+        'discnumber': 'disc'
+    }
+
+    _MP4_MAP = {
+        '\xa9nam': 'title',
+        '\xa9ART': 'artist',
+        'aART': 'album_artist',
+        '\xa9alb': 'album',
+        '\xa9gen': 'genre',
+        '\xa9day': 'year',
+        'trkn': 'track',
+        'disk': 'disc',
+        '\xa9wrt': 'composer',
+        '\xa9cmt': 'comment'
+    }
+
+    _OGG_MAP = {
+        'title': 'title',
+        'artist': 'artist',
+        'album': 'album',
+        'albumartist': 'album_artist',
+        'genre': 'genre',
+        'date': 'year',
+        'tracknumber': 'track',
+        'composer': 'composer',
+        'discnumber': 'disc',
+        'comment': 'comment'
+    }
+
+    # Extension -> (module, class) of the mutagen reader for it, imported on first use
+    _OPENERS = {
+        '.mp3': ('mutagen.mp3', 'MP3'),
+        '.flac': ('mutagen.flac', 'FLAC'),
+        '.m4a': ('mutagen.mp4', 'MP4'),
+        '.aac': ('mutagen.mp4', 'MP4'),
+        '.mp4': ('mutagen.mp4', 'MP4'),
+        '.ogg': ('mutagen.oggvorbis', 'OggVorbis')
+    }
+
+    # "Artist - Title" file names, with an optional "[year]" in the title part.
+    # Only the first bracket counts as a year, so "Song [live] [2001]" keeps its brackets
+    _NAME_RE = re.compile(
+        r'(?P<artist>.*?) - (?P<before>[^\[]*)'
+        r'(?:\[(?P<year>19\d\d|20\d\d|2100)\](?P<after>.*)|(?P<rest>.*))$',
+        re.DOTALL
+    )
+
+    # File size units, largest first; anything under 1 MB is shown in KB
+    _SIZE_UNITS = ((1 << 30, 'GB'), (1 << 20, 'MB'))
+    _ZERO_SIZE = sys.intern('0 KB')
+
+    # Below this many uncached files, spawning worker processes costs more than it saves
+    PROCESS_POOL_MIN_FILES = 64
+
+    def __init__(self, thumbnail_size=512):
+        self.thumbnail_size = thumbnail_size  # Longest edge kept for cached album art
+        self.cache = LRUCache(2048)  # Cache metadata to avoid re-reading files
+        # Guards check-then-fill on the caches so concurrent extractions agree on one entry
+        self._lock = threading.RLock()
+        self.store = MetadataStore()  # Survives restarts, behind the in-memory cache
+        # Cache album art separately; pixmaps are heavy, so bound by bytes and age too
+        self.art_cache = LRUCache(256, max_cost=50 * 1024 * 1024, cost=_pixmap_bytes, ttl=180)
+        # Tracks of one album usually embed the same cover: decoded images by hash of the bytes,
+        # and pixmaps by image cache key, so each distinct cover is decoded and uploaded once.
+        # Same byte and age limits as art_cache, so they can't keep evicted art alive
+        self._art_by_hash = LRUCache(256, max_cost=50 * 1024 * 1024, cost=_image_bytes, ttl=180)
+        self._pixmap_by_image = LRUCache(256, max_cost=50 * 1024 * 1024, cost=_image_bytes, ttl=180)
+        self.supported_extensions = frozenset({'.mp3', '.flac', '.wav', '.ogg', '.m4a', '.aac', '.wma', '.ape'})
+        self._workers = set()  # Running workers, kept alive until their finished signal is delivered
+        self._process_pool = None  # Created by the first bulk extraction big enough to need it
+        self._process_pool_lock = threading.Lock()
 
     def is_audio_file(self, file_path):
         """Check if a file is a supported audio file based on extension"""
@@ -39,35 +398,210 @@ class MetadataHandler:
         ext = os.path.splitext(file_path)[1].lower()
         return ext in self.supported_extensions
 
-    def extract_metadata(self, file_path):
-        """Extract comprehensive metadata from audio file"""
-        if not file_path or not os.path.exists(file_path):
-            return self._create_basic_metadata(file_path or "Unknown file")
+    def is_audio_file_from_entry(self, entry):
+        """is_audio_file for an os.scandir entry, using its name only"""
+        _, dot, ext = entry.name.rpartition('.')
+        return bool(dot) and '.' + ext.lower() in self.supported_extensions
+
+    def extract_metadata(self, file_path, audio=None, st=None):
+        """Extract comprehensive metadata from audio file; audio may be an already opened mutagen file"""
+        if not file_path:
+            return self._create_basic_metadata("Unknown file")
+
+        # One stat answers existence, mtime and size for everything below
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return self._create_basic_metadata(file_path)
 
         # Return cached metadata if available and file hasn't changed
-        file_mtime = os.path.getmtime(file_path)
-        if file_path in self.cache and self.cache[file_path].get('_mtime') == file_mtime:
-            return self.cache[file_path]
+        file_mtime = st.st_mtime
+        cached = self.cache.get(file_path)
+        if cached is not None and cached.get('_mtime') == file_mtime:
+            return cached
+
+        # Then the on-disk store from earlier runs
+        store_key = MetadataStore.key(file_path, st)
+        stored = self.store.get(store_key)
+        if stored is not None:
+            return self._remember(file_path, file_mtime, stored)
 
         # If mutagen isn't available, use basic metadata
         if not MUTAGEN_AVAILABLE:
-            basic_metadata = self._create_basic_metadata(file_path)
+            basic_metadata = self._create_basic_metadata(file_path, st)
             self.cache[file_path] = basic_metadata
             return basic_metadata
 
         try:
-            metadata = self._extract_with_mutagen(file_path)
+            metadata = self._extract_with_mutagen(file_path, audio, st)
             metadata['_mtime'] = file_mtime  # Store modification time for cache validation
-            self.cache[file_path] = metadata
-            return metadata
+            kept = self._remember(file_path, file_mtime, metadata)
+            if kept is metadata:
+                self.store.put(store_key, metadata)
+            return kept
         except Exception as e:
             logger.error(f"Error extracting metadata from {file_path}: {e}")
-            basic_metadata = self._create_basic_metadata(file_path)
+            basic_metadata = self._create_basic_metadata(file_path, st)
             self.cache[file_path] = basic_metadata
             return basic_metadata
 
-    def _extract_with_mutagen(self, file_path):
-        """Extract metadata using mutagen with format-specific optimizations"""
+    def _remember(self, file_path, file_mtime, metadata):
+        """Cache metadata unless another thread already cached this version; returns the entry kept"""
+        with self._lock:
+            cached = self.cache.get(file_path)
+            if cached is not None and cached.get('_mtime') == file_mtime:
+                return cached
+            self.cache[file_path] = metadata
+            return metadata
+
+    def extract_all(self, file_path):
+        """Extract metadata and album art with one open of the file; returns (metadata, pixmap)"""
+        try:
+            st = os.stat(file_path)
+        except (OSError, TypeError, ValueError):
+            return self.extract_metadata(file_path), None
+
+        pixmap = self._cached_album_art(file_path, st.st_mtime)
+        if pixmap is not None or not MUTAGEN_AVAILABLE:
+            return self.extract_metadata(file_path, st=st), pixmap
+
+        # One mutagen object serves both the tag read and the picture read
+        audio = self._open_audio(file_path)
+        metadata = self.extract_metadata(file_path, audio, st)
+        if os.path.splitext(file_path)[1].lower() in self.ART_EXTENSIONS:
+            pixmap = self._store_album_art(file_path, st.st_mtime, self._image_from_audio(audio))
+        return metadata, pixmap
+
+    def extract_metadata_bulk(self, file_paths, use_processes=True, stats=None):
+        """Extract metadata for many files at once, returning {file_path: metadata}.
+
+        Files missing from the cache are parsed on a process pool so tag parsing uses every
+        core. Pass use_processes=False for network shares, where the wait is on I/O.
+        stats may map paths to stat results the caller already has, e.g. from a scan.
+        """
+        results = {}
+        pending = []
+        stats = stats or {}
+        for file_path in file_paths:
+            st = stats.get(file_path)
+            if st is None:
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    results[file_path] = self._create_basic_metadata(file_path)
+                    continue
+            cached = self.cache.get(file_path)
+            if cached is None or cached.get('_mtime') != st.st_mtime:
+                cached = self.store.get(MetadataStore.key(file_path, st))
+                if cached is not None:
+                    cached = self._remember(file_path, st.st_mtime, cached)
+            if cached is not None:
+                results[file_path] = cached
+            else:
+                pending.append((file_path, st))
+
+        if not pending:
+            return results
+
+        if not MUTAGEN_AVAILABLE:
+            for file_path, st in pending:
+                results[file_path] = self.cache[file_path] = self._create_basic_metadata(file_path, st)
+            return results
+
+        paths, stats = zip(*pending)
+        if use_processes and len(pending) >= self.PROCESS_POOL_MIN_FILES:
+            # Spawned workers stay up between calls, so their startup is paid once
+            parsed = list(self._get_process_pool().map(_extract_in_worker, paths, stats, chunksize=32))
+        else:
+            # Threads share this handler; only spawned processes need their own
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                parsed = list(executor.map(self._parse_for_bulk, paths, stats))
+
+        # Display strings for every parsed file in one vectorized pass
+        fresh = [metadata for metadata in parsed if metadata is not None]
+        if fresh:
+            columns = format_columns([m['length'] for m in fresh],
+                                     [m['bitrate'] for m in fresh],
+                                     [m['file_size'] for m in fresh])
+            for metadata, length_str, bitrate_str, size_str in zip(fresh, *columns):
+                metadata['length_formatted'] = length_str
+                metadata['bitrate_formatted'] = bitrate_str
+                metadata['file_size_formatted'] = size_str
+
+        # Results are merged into the cache here, in the calling process
+        for (file_path, st), metadata in zip(pending, parsed):
+            if metadata is None:
+                metadata = self._create_basic_metadata(file_path, st)
+                self.cache[file_path] = metadata
+            else:
+                metadata['_mtime'] = st.st_mtime  # Store modification time for cache validation
+                kept = self._remember(file_path, st.st_mtime, metadata)
+                if kept is metadata:
+                    self.store.put(MetadataStore.key(file_path, st), metadata)
+                metadata = kept
+            results[file_path] = metadata
+        self.store.flush()
+        return results
+
+    def _get_process_pool(self):
+        """The shared tag-parsing process pool, started on first use"""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # Spawned workers: forking a process that runs Qt threads is unsafe
+                self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                         mp_context=multiprocessing.get_context("spawn"))
+            return self._process_pool
+
+    def extract_metadata_bulk_async(self, file_paths, callback, stats=None):
+        """Run extract_metadata_bulk on the global thread pool.
+
+        callback({file_path: metadata}) is invoked on the GUI thread when done.
+        """
+        worker = BulkMetadataWorker(self, list(file_paths), stats)
+        worker.signals.finished.connect(callback)
+        worker.signals.finished.connect(lambda *_: self._workers.discard(worker))
+        self._workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def _parse_for_bulk(self, file_path, st=None):
+        """Parse one file's tags for extract_metadata_bulk, or None if it can't be read"""
+        try:
+            # The caller formats the display columns for the whole batch
+            return self._extract_with_mutagen(file_path, st=st, formatted=False)
+        except Exception as e:
+            logger.error(f"Error extracting metadata from {file_path}: {e}")
+            return None
+
+    def extract_metadata_async(self, file_path, callback):
+        """Extract metadata on the global thread pool.
+
+        callback(file_path, metadata) is invoked on the GUI thread when done.
+        """
+        worker = MetadataWorker(self, file_path)
+        worker.signals.finished.connect(callback)
+        worker.signals.finished.connect(lambda *_: self._workers.discard(worker))
+        self._workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def _open_audio(self, file_path):
+        """Open a file with the mutagen class for its extension; None if unsupported or unreadable"""
+        ext = os.path.splitext(file_path)[1].lower()
+        opener = self._OPENERS.get(ext)
+        try:
+            if opener is not None:
+                return _mutagen_class(*opener)(file_path)
+            if ext in self.supported_extensions:
+                return mutagen.File(file_path)
+        except Exception as e:
+            logger.error(f"Error opening {file_path}: {e}")
+        return None
+
+    def _extract_with_mutagen(self, file_path, audio=None, st=None, formatted=True):
+        """Extract metadata using mutagen with format-specific optimizations.
+
+        With formatted=False the *_formatted display fields are left for the caller to fill.
+        """
         metadata = {
             'title': os.path.splitext(os.path.basename(file_path))[0],
             'artist': 'Unknown Artist',
@@ -80,31 +614,22 @@ class MetadataHandler:
             'sample_rate': 0,
             'channels': 2,
             'path': file_path,
-            'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0
+            'file_size': st.st_size if st is not None else self._file_size(file_path)
         }
 
-        # Extract file extension to determine type
-        ext = os.path.splitext(file_path)[1].lower()
+        if audio is None:
+            audio = self._open_audio(file_path)
 
         # Format-specific extraction
-        if ext == '.mp3':
-            metadata = self._extract_mp3_metadata(file_path, metadata)
-        elif ext == '.flac':
-            metadata = self._extract_flac_metadata(file_path, metadata)
-        elif ext == '.m4a' or ext == '.aac' or ext == '.mp4':
-            metadata = self._extract_mp4_metadata(file_path, metadata)
-        elif ext == '.ogg':
-            metadata = self._extract_ogg_metadata(file_path, metadata)
-        elif ext == '.wma':
-            # Generic extraction for WMA
-            audio_file = File(file_path)
-            if audio_file:
-                self._extract_generic_metadata(audio_file, metadata)
-        else:
-            # Generic extraction for other formats
-            audio_file = File(file_path)
-            if audio_file:
-                self._extract_generic_metadata(audio_file, metadata)
+        reader = self._READERS.get(type(audio).__name__)
+        if reader is not None:
+            metadata = reader(self, audio, metadata)
+        elif audio:
+            # Generic extraction for WMA and other formats
+            self._extract_generic_metadata(audio, metadata)
+
+        if not formatted:
+            return metadata
 
         # Format file size
         metadata['file_size_formatted'] = self._format_file_size(metadata['file_size'])
@@ -125,11 +650,10 @@ class MetadataHandler:
 
         return metadata
 
-    def _extract_mp3_metadata(self, file_path, metadata):
+    def _extract_mp3_metadata(self, mp3, metadata):
         """Extract metadata specifically from MP3 files"""
         try:
-            mp3 = MP3(file_path)
-            audio_file = ID3(file_path)
+            audio_file = mp3.tags or {}  # ID3 tags parsed by the same open as the stream info
 
             # Extract basic audio properties
             metadata['length'] = mp3.info.length
@@ -137,22 +661,7 @@ class MetadataHandler:
             metadata['sample_rate'] = mp3.info.sample_rate
             metadata['channels'] = getattr(mp3.info, 'channels', 2)
 
-            # ID3 tags mapping
-            id3_mapping = {
-                'TIT2': 'title',
-                'TPE1': 'artist',
-                'TPE2': 'album_artist',
-                'TALB': 'album',
-                'TCON': 'genre',
-                'TDRC': 'year',
-                'TYER': 'year',
-                'TRCK': 'track',
-                'TPOS': 'disc',
-                'TCOM': 'composer',
-                'COMM': 'comment'
-            }
-
-            for tag, field in id3_mapping.items():
+            for tag, field in self._ID3_MAP.items():
                 if tag in audio_file:
                     metadata[field] = str(audio_file[tag].text[0])
 
@@ -171,11 +680,9 @@ class MetadataHandler:
 
         return metadata
 
-    def _extract_flac_metadata(self, file_path, metadata):
+    def _extract_flac_metadata(self, flac, metadata):
         """Extract metadata specifically from FLAC files"""
         try:
-            flac = FLAC(file_path)
-
             # Extract audio properties
             metadata['length'] = flac.info.length
             metadata['bitrate'] = flac.info.bitrate
@@ -183,20 +690,7 @@ class MetadataHandler:
             metadata['channels'] = flac.info.channels
             metadata['bits_per_sample'] = flac.info.bits_per_sample
 
-            # Map FLAC tags
-            flac_mapping = {
-                'title': 'title',
-                'artist': 'artist',
-                'album': 'album',
-                'albumartist': 'album_artist',
-                'genre': 'genre',
-                'date': 'year',
-                'tracknumber': 'track',
-                'composer': 'composer',
-                'discnumber': 'disc'
-            }
-
-            for tag, field in flac_mapping.items():
+            for tag, field in self._FLAC_MAP.items():
                 if tag in flac:
                     metadata[field] = flac[tag][0]
 
@@ -205,32 +699,16 @@ class MetadataHandler:
 
         return metadata
 
-    def _extract_mp4_metadata(self, file_path, metadata):
+    def _extract_mp4_metadata(self, mp4, metadata):
         """Extract metadata specifically from M4A/MP4/AAC files"""
         try:
-            mp4 = MP4(file_path)
-
             # Extract audio properties
             metadata['length'] = mp4.info.length
             metadata['bitrate'] = mp4.info.bitrate
             metadata['sample_rate'] = mp4.info.sample_rate
             metadata['channels'] = mp4.info.channels
 
-            # MP4 tags mapping
-            mp4_mapping = {
-                '\xa9nam': 'title',
-                '\xa9ART': 'artist',
-                'aART': 'album_artist',
-                '\xa9alb': 'album',
-                '\xa9gen': 'genre',
-                '\xa9day': 'year',
-                'trkn': 'track',
-                'disk': 'disc',
-                '\xa9wrt': 'composer',
-                '\xa9cmt': 'comment'
-            }
-
-            for tag, field in mp4_mapping.items():
+            for tag, field in self._MP4_MAP.items():
                 if tag in mp4:
                     if tag in ['trkn', 'disk']:
                         # Handle tuple format (track_num, total_tracks)
@@ -246,32 +724,16 @@ class MetadataHandler:
 
         return metadata
 
-    def _extract_ogg_metadata(self, file_path, metadata):
+    def _extract_ogg_metadata(self, ogg, metadata):
         """Extract metadata specifically from OGG files"""
         try:
-            ogg = OggVorbis(file_path)
-
             # Extract audio properties
             metadata['length'] = ogg.info.length
             metadata['bitrate'] = ogg.info.bitrate
             metadata['sample_rate'] = ogg.info.sample_rate
             metadata['channels'] = ogg.info.channels
 
-            # OGG tags mapping
-            ogg_mapping = {
-                'title': 'title',
-                'artist': 'artist',
-                'album': 'album',
-                'albumartist': 'album_artist',
-                'genre': 'genre',
-                'date': 'year',
-                'tracknumber': 'track',
-                'composer': 'composer',
-                'discnumber': 'disc',
-                'comment': 'comment'
-            }
-
-            for tag, field in ogg_mapping.items():
+            for tag, field in self._OGG_MAP.items():
                 if tag in ogg:
                     metadata[field] = ogg[tag][0]
 
@@ -280,6 +742,14 @@ class MetadataHandler:
 
         return metadata
 
+    # mutagen class name -> tag reader; names, so no format module is imported to build this
+    _READERS = {
+        'MP3': _extract_mp3_metadata,
+        'FLAC': _extract_flac_metadata,
+        'MP4': _extract_mp4_metadata,
+        'OggVorbis': _extract_ogg_metadata
+    }
+
     def _extract_generic_metadata(self, audio_file, metadata):
         """Extract metadata from generic audio file"""
         try:
@@ -314,7 +784,7 @@ class MetadataHandler:
 
         return metadata
 
-    def _create_basic_metadata(self, file_path):
+    def _create_basic_metadata(self, file_path, st=None):
         """Create basic metadata from filename when extraction fails"""
         filename = os.path.splitext(os.path.basename(file_path))[0]
 
@@ -332,102 +802,171 @@ class MetadataHandler:
             'sample_rate': 0,
             'channels': 2,
             'path': file_path,
-            'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0,
-            'file_size_formatted': '0 KB'
+            'file_size': st.st_size if st is not None else self._file_size(file_path),
+            'file_size_formatted': self._ZERO_SIZE
         }
 
-        # Try to parse artist - title format
-        if ' - ' in filename:
-            parts = filename.split(' - ', 1)
-            metadata['artist'] = parts[0].strip()
-            metadata['title'] = parts[1].strip()
-
-            # Try to extract more from the title part (e.g. "Album [2022]")
-            title_part = parts[1]
-            if '[' in title_part and ']' in title_part:
-                bracket_content = title_part[title_part.find('[') + 1:title_part.find(']')]
-
-                # Check if bracket content is a year
-                if bracket_content.isdigit() and 1900 <= int(bracket_content) <= 2100:
-                    metadata['year'] = bracket_content
-                    metadata['title'] = metadata['title'].replace(f'[{bracket_content}]', '').strip()
+        # Try to parse artist - title format (e.g. "Artist - Song [2022]")
+        match = self._NAME_RE.match(filename)
+        if match:
+            metadata['artist'] = match['artist'].strip()
+            year = match['year']
+            if year:
+                metadata['year'] = year
+                metadata['title'] = (match['before'] + match['after']).strip()
+            else:
+                metadata['title'] = (match['before'] + match['rest']).strip()
 
         return metadata
 
     def extract_album_art(self, file_path):
         """Extract album art from audio file with better error handling and caching"""
-        if not file_path or not os.path.exists(file_path):
+        if not file_path:
+            return None
+
+        # Skip the header probe for formats that never carry artwork
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in self.ART_EXTENSIONS:
+            return None
+
+        # A single stat doubles as the existence check
+        try:
+            file_mtime = os.stat(file_path).st_mtime
+        except OSError:
             return None
 
         # Return cached art if available and file hasn't changed
-        file_mtime = os.path.getmtime(file_path)
-        if file_path in self.art_cache:
-            cached_art, cached_mtime = self.art_cache[file_path]
-            if cached_mtime == file_mtime:
-                return cached_art
+        cached_art = self._cached_album_art(file_path, file_mtime)
+        if cached_art is not None:
+            return cached_art
 
         if not MUTAGEN_AVAILABLE:
             return None
 
+        return self._store_album_art(file_path, file_mtime, self._read_album_image(file_path))
+
+    def extract_album_art_async(self, file_path, callback):
+        """Extract album art with the tag read and image decode on the global thread pool.
+
+        callback(file_path, pixmap) is invoked on the GUI thread; pixmap is None when the
+        file has no usable art.
+        """
+        # Art already cached for the unchanged file is handed back straight away
+        cached_art = self._cached_album_art(file_path)
+        if cached_art is not None:
+            callback(file_path, cached_art)
+            return
+
+        worker = AlbumArtWorker(self, file_path)
+        worker.signals.finished.connect(
+            lambda path, image, mtime: callback(path, self._store_album_art(path, mtime, image))
+        )
+        worker.signals.finished.connect(lambda *_: self._workers.discard(worker))
+        self._workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def _cached_album_art(self, file_path, file_mtime=None):
+        """Return the cached pixmap for a file if it has not changed since, else None"""
+        cached = self.art_cache.get(file_path)
+        if cached is None:
+            return None
+        if file_mtime is None:
+            try:
+                file_mtime = os.stat(file_path).st_mtime
+            except OSError:
+                return None
+        return cached[0] if cached[1] == file_mtime else None
+
+    def _read_album_image(self, file_path):
+        """Read and decode embedded art as a QImage, or None; safe off the GUI thread"""
+        if not file_path or not MUTAGEN_AVAILABLE:
+            return None
+
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in self.ART_EXTENSIONS:
+            return None
+
+        return self._image_from_audio(self._open_audio(file_path))
+
+    def _image_from_audio(self, audio):
+        """Decode the first usable picture of an opened mutagen file, or None"""
+        if audio is None:
+            return None
+
         try:
-            pixmap = None
-            file_ext = os.path.splitext(file_path)[1].lower()
-
-            if file_ext == '.mp3':
-                # MP3 files with ID3 tags
-                audio = ID3(file_path)
-                for tag in audio.values():
-                    if tag.FrameID in ('APIC', 'PIC'):
-                        img_data = getattr(tag, 'data', None)
-                        if img_data:
-                            img = QImage.fromData(img_data)
-                            if not img.isNull():
-                                pixmap = QPixmap.fromImage(img)
-                                break
-
-            elif file_ext == '.flac':
-                # FLAC files with embedded pictures
-                audio = FLAC(file_path)
-                if hasattr(audio, 'pictures') and audio.pictures:
-                    img = QImage.fromData(audio.pictures[0].data)
-                    if not img.isNull():
-                        pixmap = QPixmap.fromImage(img)
-
-            elif file_ext in ['.m4a', '.mp4', '.aac']:
+            image = None
+
+            kind = type(audio).__name__
+            if kind == 'MP3':
+                # MP3 files with ID3 tags; picture frames are looked up directly, not scanned for
+                tags = audio.tags
+                pictures = (tags.getall('APIC') or tags.getall('PIC')) if tags else []
+                for picture in pictures:
+                    if picture.data:
+                        image = self._thumbnail(picture.data)
+                        if image:
+                            break
+
+            elif kind == 'MP4':
                 # MP4/M4A files
-                audio = MP4(file_path)
                 if 'covr' in audio:
                     for cover in audio['covr']:
-                        img = QImage.fromData(cover)
-                        if not img.isNull():
-                            pixmap = QPixmap.fromImage(img)
+                        image = self._thumbnail(cover)
+                        if image:
                             break
 
-            else:
-                # Generic approach for other formats
-                audio = File(file_path)
-                if hasattr(audio, 'pictures') and audio.pictures:
-                    img = QImage.fromData(audio.pictures[0].data)
-                    if not img.isNull():
-                        pixmap = QPixmap.fromImage(img)
+            elif hasattr(audio, 'pictures') and audio.pictures:
+                # FLAC and other formats with embedded pictures
+                image = self._thumbnail(audio.pictures[0].data)
 
-            # Cache the result
-            if pixmap and not pixmap.isNull():
-                self.art_cache[file_path] = (pixmap, file_mtime)
-
-            return pixmap
+            return image
 
         except Exception as e:
             logger.error(f"Error extracting album art: {e}")
             return None
 
+    def _store_album_art(self, file_path, file_mtime, image):
+        """Turn a decoded image into a cached pixmap; GUI thread only, since QPixmap is"""
+        if image is None:
+            return None
+        pixmap = self._pixmap_by_image.get(image.cacheKey())
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(image)
+            if pixmap.isNull():
+                return None
+            self._pixmap_by_image[image.cacheKey()] = pixmap
+        with self._lock:
+            # A pixmap cached meanwhile for the same file version wins
+            cached = self.art_cache.get(file_path)
+            if cached is not None and cached[1] == file_mtime:
+                return cached[0]
+            self.art_cache[file_path] = (pixmap, file_mtime)
+        return pixmap
+
+    def _thumbnail(self, img_data):
+        """Decode cover bytes to an image no larger than thumbnail_size, or None"""
+        digest = hashlib.blake2b(img_data, digest_size=16).digest()
+        img = self._art_by_hash.get(digest)
+        if img is not None:
+            return img
+
+        img = QImage.fromData(img_data)
+        if img.isNull():
+            return None
+        size = self.thumbnail_size
+        if img.width() > size or img.height() > size:
+            img = img.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+        self._art_by_hash[digest] = img
+        return img
+
     def get_all_metadata_fields(self, file_path):
         """Get all available metadata fields for a file (for debugging/display)"""
         if not MUTAGEN_AVAILABLE or not file_path or not os.path.exists(file_path):
             return {}
 
         try:
-            audio_file = File(file_path)
+            audio_file = mutagen.File(file_path)
             if not audio_file:
                 return {}
 
@@ -462,17 +1001,33 @@ class MetadataHandler:
 
     def clear_cache(self):
         """Clear the metadata cache"""
-        self.cache = {}
-        self.art_cache = {}
+        self.cache.clear()
+        self.art_cache.clear()
+        self._art_by_hash.clear()
+        self._pixmap_by_image.clear()
+
+    def close(self):
+        """Stop the parsing processes, then write out and close the on-disk metadata store"""
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
+        self.store.close()
+
+    @staticmethod
+    def _file_size(file_path):
+        """Size of a file in bytes, or 0 if it cannot be read"""
+        try:
+            return os.stat(file_path).st_size
+        except OSError:
+            return 0
 
     def _format_file_size(self, size_in_bytes):
         """Format file size from bytes to human-readable format"""
         if not size_in_bytes:
-            return "0 KB"
+            return self._ZERO_SIZE
 
-        kb_size = size_in_bytes / 1024
-        if kb_size < 1024:
-            return f"{kb_size:.2f} KB"
-        else:
-            mb_size = kb_size / 1024
-            return f"{mb_size:.2f} MB"
\ No newline at end of file
+        for divisor, unit in self._SIZE_UNITS:
+            if size_in_bytes >= divisor:
+                return f"{size_in_bytes / divisor:.2f} {unit}"
+        return f"{size_in_bytes / 1024:.2f} KB"
\ No newline at end of file
@@ -1,4 +1,6 @@
 import os
+import time
+from collections import OrderedDict
 import vlc
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
@@ -6,6 +8,11 @@ from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 class Player(QObject):
     """Core audio player handling VLC media playback"""
 
+    # VLC position events are forwarded at most this often
+    POSITION_EMIT_INTERVAL = 0.1
+    # Parsed vlc.Media objects kept for tracks played or preloaded recently
+    MEDIA_CACHE_SIZE = 8
+
     # Signals
     positionChanged = pyqtSignal(int, int)  # current_ms, total_ms
     stateChanged = pyqtSignal(str)  # 'playing', 'paused', 'stopped', 'error'
@@ -17,25 +24,43 @@ class Player(QObject):
         self.media_player = None
         self.vlc_instance = None
         self.current_media = None
+        self._length = 0  # Track length in ms, kept current by VLC's LengthChanged event
+        self._last_position_emit = 0.0
+        self._media_cache = OrderedDict()  # file_path -> (vlc.Media, mtime)
         self._initialize_vlc()
 
-        # Setup timer for position updates
+        # Position normally arrives through VLC events; this timer is only a watchdog
         self.timer = QTimer()
-        self.timer.setInterval(100)  # 100ms refresh
+        self.timer.setInterval(500)
         self.timer.timeout.connect(self._update_position)
         self.timer.start()
 
     def _initialize_vlc(self):
         """Initialize VLC instance with error handling"""
         try:
-            # More conservative VLC initialization
-            self.vlc_instance = vlc.Instance([
-                '--no-xlib',  # Disable X11 (helps on some systems)
-                '--quiet',  # Reduce VLC output
-                '--intf=dummy'  # No interface
-            ])
-            self.media_player = self.vlc_instance.media_player_new()
+            try:
+                # More conservative VLC initialization
+                self.vlc_instance = vlc.Instance([
+                    '--no-xlib',  # Disable X11 (helps on some systems)
+                    '--quiet',  # Reduce VLC output
+                    '--intf=dummy',  # No interface
+                    '--file-caching=300',  # Short prebuffer for fast track start
+                    '--network-caching=300',
+                    '--live-caching=300',
+                    '--clock-jitter=0',
+                    '--clock-synchro=0'
+                ])
+                self.media_player = self.vlc_instance.media_player_new()
+            except Exception as e:
+                print(f"VLC low-latency init failed, retrying with defaults: {e}")
+                self.vlc_instance = vlc.Instance(['--no-xlib', '--quiet', '--intf=dummy'])
+                self.media_player = self.vlc_instance.media_player_new()
             self.vlc_available = True
+
+            # Let VLC push position changes instead of polling it
+            events = self.media_player.event_manager()
+            events.event_attach(vlc.EventType.MediaPlayerPositionChanged, self._on_position_changed)
+            events.event_attach(vlc.EventType.MediaPlayerLengthChanged, self._on_length_changed)
         except Exception as e:
             print(f"VLC initialization failed: {e}")
             self.vlc_available = False
@@ -47,16 +72,51 @@ class Player(QObject):
             return False
 
         try:
-            # Create media and set it to the player
-            media = self.vlc_instance.media_new(file_path)
+            # Reuse the parsed media when returning to (or preloading) a track
+            media = self._get_media(file_path)
             self.media_player.set_media(media)
             self.current_media = file_path
+            self._length = 0
             self.mediaChanged.emit(file_path)
             return True
         except Exception as e:
             print(f"Error loading media: {e}")
             return False
 
+    def preload(self, file_path):
+        """Create and parse the media for a track that is likely to play next"""
+        if not self.vlc_available or not file_path:
+            return False
+
+        try:
+            media = self._get_media(file_path)
+            # Asynchronous in libvlc: parsing runs on VLC's own threads
+            media.parse_with_options(vlc.MediaParseFlag.local, 0)
+            return True
+        except Exception as e:
+            print(f"Error preloading media: {e}")
+            return False
+
+    def _get_media(self, file_path):
+        """vlc.Media for a path, from the cache unless the file changed since"""
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
+            mtime = None
+
+        entry = self._media_cache.get(file_path)
+        if entry is not None and entry[1] == mtime:
+            self._media_cache.move_to_end(file_path)
+            return entry[0]
+
+        media = self.vlc_instance.media_new(file_path)
+        self._media_cache[file_path] = (media, mtime)
+        self._media_cache.move_to_end(file_path)
+        while len(self._media_cache) > self.MEDIA_CACHE_SIZE:
+            _, (old_media, _) = self._media_cache.popitem(last=False)
+            old_media.release()
+        return media
+
     def play(self):
         """Play the currently loaded media"""
         if not self.vlc_available:
@@ -150,9 +210,21 @@ class Player(QObject):
             print(f"Error setting volume: {e}")
             return False
 
+    def _on_length_changed(self, event):
+        """VLC event (on VLC's thread): the track length became known"""
+        self._length = event.u.new_length
+
+    def _on_position_changed(self, event):
+        """VLC event (on VLC's thread): forward the new position, throttled"""
+        now = time.monotonic()
+        if now - self._last_position_emit < self.POSITION_EMIT_INTERVAL or self._length <= 0:
+            return
+        self._last_position_emit = now
+        self.positionChanged.emit(int(event.u.new_position * self._length), self._length)
+
     def _update_position(self):
-        """Update the current playback position"""
-        if not self.vlc_available:
+        """Poll the playback position when VLC has not reported it recently"""
+        if not self.vlc_available or time.monotonic() - self._last_position_emit < 0.5:
             return
 
         try:
@@ -160,6 +232,7 @@ class Player(QObject):
                 length = self.media_player.get_length()
                 current = self.media_player.get_time()
                 if length > 0 and current >= 0:
+                    self._last_position_emit = time.monotonic()
                     self.positionChanged.emit(current, length)
         except:
             # Silently handle VLC errors
@@ -202,5 +275,8 @@ class Player(QObject):
                     if self.media_player.is_playing():
                         self.media_player.stop()
                     self.media_player.release()
+                for media, _ in self._media_cache.values():
+                    media.release()
+                self._media_cache.clear()
             except Exception as e:
                 print(f"Error during cleanup: {e}")
\ No newline at end of file
@@ -1,6 +1,40 @@
 import os
-import json
-from PyQt6.QtCore import QObject, pyqtSignal
+import sys
+import functools
+import threading
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+@functools.lru_cache(maxsize=None)
+def _json_module():
+    """orjson if installed, else the standard json module; imported on first playlist I/O"""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        import json
+        return json
+
+
+class PlaylistIOWorker(QRunnable):
+    """Worker thread for reading or writing the playlists file"""
+
+    class Signals(QObject):
+        finished = pyqtSignal(object)  # result of the I/O call, None on failure
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            print(f"Error in playlist I/O: {e}")
+            result = None
+        self.signals.finished.emit(result)
 
 
 class PlaylistManager(QObject):
@@ -9,17 +43,24 @@ class PlaylistManager(QObject):
     # Signals
     playlistChanged = pyqtSignal(str, list)  # playlist_name, tracks_list
     currentTrackChanged = pyqtSignal(int, str)  # track_index, track_path
+    saveFinished = pyqtSignal(bool)  # from save_playlists_async
+    loadFinished = pyqtSignal(bool)  # from load_playlists_async
+
+    _io_lock = threading.Lock()  # Serializes writes to the playlist files
 
     def __init__(self):
         super().__init__()
         self.playlists = {}  # Dictionary of playlist name -> list of tracks
+        self._track_index = {}  # playlist name -> set of its tracks, for membership checks
         self.current_playlist = None
         self.current_track_index = -1
+        self.loading = False  # True while load_playlists_async is still reading
 
     def create_playlist(self, name):
         """Create a new playlist"""
         if name and name not in self.playlists:
             self.playlists[name] = []
+            self._track_index[name] = set()
             self.playlistChanged.emit(name, [])
             return True
         return False
@@ -27,8 +68,10 @@ class PlaylistManager(QObject):
     def add_to_playlist(self, playlist_name, track_path):
         """Add a track to a playlist"""
         if playlist_name in self.playlists:
-            if track_path not in self.playlists[playlist_name]:
+            track_path = sys.intern(track_path)
+            if track_path not in self._track_index[playlist_name]:
                 self.playlists[playlist_name].append(track_path)
+                self._track_index[playlist_name].add(track_path)
                 self.playlistChanged.emit(playlist_name, self.playlists[playlist_name])
                 return True
         return False
@@ -37,9 +80,12 @@ class PlaylistManager(QObject):
         """Add multiple files to a playlist"""
         if playlist_name in self.playlists:
             added = False
-            for path in file_paths:
-                if path not in self.playlists[playlist_name]:
-                    self.playlists[playlist_name].append(path)
+            tracks = self.playlists[playlist_name]
+            index = self._track_index[playlist_name]
+            for path in map(sys.intern, file_paths):
+                if path not in index:
+                    tracks.append(path)
+                    index.add(path)
                     added = True
 
             if added:
@@ -50,7 +96,8 @@ class PlaylistManager(QObject):
     def remove_from_playlist(self, playlist_name, track_index):
         """Remove a track from a playlist by index"""
         if playlist_name in self.playlists and 0 <= track_index < len(self.playlists[playlist_name]):
-            del self.playlists[playlist_name][track_index]
+            track_path = self.playlists[playlist_name].pop(track_index)
+            self._track_index[playlist_name].discard(track_path)
             self.playlistChanged.emit(playlist_name, self.playlists[playlist_name])
             return True
         return False
@@ -77,30 +124,194 @@ class PlaylistManager(QObject):
 
     def next_track(self):
         """Move to the next track in playlist"""
-        if not self.current_playlist or not self.playlists[self.current_playlist]:
+        if not self.current_playlist:
+            return None
+        tracks = self.playlists[self.current_playlist]
+        if not tracks:
             return None
 
-        self.current_track_index = (self.current_track_index + 1) % len(self.playlists[self.current_playlist])
-        track_path = self.playlists[self.current_playlist][self.current_track_index]
-        self.currentTrackChanged.emit(self.current_track_index, track_path)
+        # Wrap around with a compare instead of a modulo
+        index = self.current_track_index + 1
+        if index >= len(tracks):
+            index = 0
+        self.current_track_index = index
+        track_path = tracks[index]
+        self.currentTrackChanged.emit(index, track_path)
         return track_path
 
+    def peek_next_track(self):
+        """Path of the track next_track() would move to, without moving"""
+        if not self.current_playlist:
+            return None
+        tracks = self.playlists[self.current_playlist]
+        if not tracks:
+            return None
+
+        index = self.current_track_index + 1
+        return tracks[index if index < len(tracks) else 0]
+
     def previous_track(self):
         """Move to the previous track in playlist"""
-        if not self.current_playlist or not self.playlists[self.current_playlist]:
+        if not self.current_playlist:
+            return None
+        tracks = self.playlists[self.current_playlist]
+        if not tracks:
             return None
 
-        self.current_track_index = (self.current_track_index - 1) % len(self.playlists[self.current_playlist])
-        track_path = self.playlists[self.current_playlist][self.current_track_index]
-        self.currentTrackChanged.emit(self.current_track_index, track_path)
+        # Wrap around with a compare instead of a modulo
+        index = self.current_track_index - 1
+        if index < 0 or index >= len(tracks):
+            index = len(tracks) - 1
+        self.current_track_index = index
+        track_path = tracks[index]
+        self.currentTrackChanged.emit(index, track_path)
         return track_path
 
+    @staticmethod
+    def _existing_tracks(tracks, listings):
+        """Tracks that still exist, checked with one directory listing per folder"""
+        existing = []
+        for track in tracks:
+            directory, filename = os.path.split(track)
+            names = listings.get(directory)
+            if names is None:
+                try:
+                    names = set(os.listdir(directory or '.'))
+                except OSError:
+                    names = set()
+                listings[directory] = names
+            # A miss is confirmed with a stat, since names may differ only in case
+            if filename in names or os.path.exists(track):
+                existing.append(track)
+        return existing
+
+    @staticmethod
+    def _read_json(filepath):
+        """Parse a JSON file with orjson when available"""
+        # Both modules accept bytes
+        with open(filepath, 'rb') as f:
+            return _json_module().loads(f.read())
+
+    @staticmethod
+    def _write_json(filepath, data):
+        """Write data as JSON atomically, so a crash can't leave a truncated file"""
+        tmp_path = filepath + '.tmp'
+        codec = _json_module()
+        if codec.__name__ == 'orjson':
+            with open(tmp_path, 'wb') as f:
+                f.write(codec.dumps(data, option=codec.OPT_APPEND_NEWLINE))
+        else:
+            with open(tmp_path, 'w') as f:
+                codec.dump(data, f)
+        os.replace(tmp_path, filepath)
+
+    @staticmethod
+    def _validation_cache_path(filepath):
+        return os.path.splitext(filepath)[0] + '.cache.json'
+
+    @staticmethod
+    def _dir_mtimes(playlists):
+        """mtime_ns of every directory holding a track; adding or deleting a file changes it"""
+        mtimes = {}
+        for tracks in playlists.values():
+            for track in tracks:
+                directory = os.path.dirname(track)
+                if directory not in mtimes:
+                    try:
+                        mtimes[directory] = os.stat(directory or '.').st_mtime_ns
+                    except OSError:
+                        mtimes[directory] = None
+        return mtimes
+
+    def _load_validated(self, filepath, st):
+        """Validated playlists from the cache if neither the file nor track folders changed"""
+        try:
+            cache = self._read_json(self._validation_cache_path(filepath))
+            if cache['mtime'] != st.st_mtime_ns or cache['size'] != st.st_size:
+                return None
+            if self._dir_mtimes(cache['data']) != cache['dirs']:
+                return None
+            return cache['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def _write_playlists(cls, filepath, playlists):
+        """Write playlists to disk and refresh the validation cache to match"""
+        with cls._io_lock:  # Saves may overlap when run on the thread pool
+            cls._write_json(filepath, playlists)
+            # The tracks being saved are known to be valid, so the next load can skip checking them
+            try:
+                cls._write_validation_cache(filepath, os.stat(filepath), playlists)
+            except OSError as e:
+                print(f"Error writing playlist validation cache: {e}")
+                try:
+                    os.remove(cls._validation_cache_path(filepath))
+                except OSError:
+                    pass
+        return True
+
+    @classmethod
+    def _write_validation_cache(cls, filepath, st, playlists):
+        """Record playlists as validated for the playlists file with stat result st"""
+        cls._write_json(cls._validation_cache_path(filepath), {
+            'mtime': st.st_mtime_ns,
+            'size': st.st_size,
+            'dirs': cls._dir_mtimes(playlists),
+            'data': playlists,
+        })
+
+    def _read_playlists(self, filepath):
+        """Read and validate playlists from disk, or None if there is no file.
+
+        Only touches the file system, so it is safe to run on a worker thread.
+        """
+        if not os.path.exists(filepath):
+            return None
+
+        st = os.stat(filepath)
+        validated = self._load_validated(filepath, st)
+        if validated is not None:
+            # Nothing changed since the last check; skip validating every track
+            return {name: [sys.intern(track) for track in tracks] for name, tracks in validated.items()}
+
+        playlists = self._read_json(filepath)
+        listings = {}  # directory -> names in it, shared by every playlist
+
+        # Validate loaded playlists (ensure they're still valid paths)
+        for name, tracks in list(playlists.items()):
+            # Interned so a track shared by several playlists is stored once;
+            # dict.fromkeys drops duplicates while keeping the order
+            valid_tracks = self._existing_tracks(dict.fromkeys(map(sys.intern, tracks)), listings)
+            if valid_tracks:
+                playlists[name] = valid_tracks
+            else:
+                # Remove empty playlists
+                del playlists[name]
+
+        # Remember the result for the next start
+        try:
+            self._write_validation_cache(filepath, st, playlists)
+        except OSError as e:
+            print(f"Error writing playlist validation cache: {e}")
+
+        return playlists
+
+    def _apply_playlists(self, playlists):
+        """Replace the playlists with ones read from disk"""
+        self.playlists = playlists
+        self._track_index = {name: set(tracks) for name, tracks in playlists.items()}
+        for name, tracks in playlists.items():
+            self.playlistChanged.emit(name, tracks)
+
     def save_playlists(self, filepath="playlists.json"):
         """Save playlists to a JSON file"""
+        if self.loading:
+            # Saving now would replace the file with the still empty playlists
+            print("Playlists are still loading; not saving")
+            return False
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.playlists, f)
-            return True
+            return self._write_playlists(filepath, self.playlists)
         except Exception as e:
             print(f"Error saving playlists: {e}")
             return False
@@ -108,21 +319,40 @@ class PlaylistManager(QObject):
     def load_playlists(self, filepath="playlists.json"):
         """Load playlists from a JSON file"""
         try:
-            if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    self.playlists = json.load(f)
-
-                # Validate loaded playlists (ensure they're still valid paths)
-                for name, tracks in list(self.playlists.items()):
-                    valid_tracks = [track for track in tracks if os.path.exists(track)]
-                    if valid_tracks:
-                        self.playlists[name] = valid_tracks
-                        self.playlistChanged.emit(name, valid_tracks)
-                    else:
-                        # Remove empty playlists
-                        del self.playlists[name]
-
+            playlists = self._read_playlists(filepath)
+            if playlists is not None:
+                self._apply_playlists(playlists)
                 return True
         except Exception as e:
             print(f"Error loading playlists: {e}")
-        return False
\ No newline at end of file
+        return False
+
+    def save_playlists_async(self, filepath="playlists.json"):
+        """Save playlists on the thread pool; saveFinished reports the result"""
+        if self.loading:
+            print("Playlists are still loading; not saving")
+            self.saveFinished.emit(False)
+            return
+        # Snapshot the lists so edits made while saving don't race the writer
+        snapshot = {name: list(tracks) for name, tracks in self.playlists.items()}
+        worker = PlaylistIOWorker(self._write_playlists, filepath, snapshot)
+        worker.signals.finished.connect(lambda result: self.saveFinished.emit(bool(result)))
+        self._save_worker = worker  # Keep the signals object alive until it reports
+        QThreadPool.globalInstance().start(worker)
+
+    def load_playlists_async(self, filepath="playlists.json"):
+        """Load playlists on the thread pool; loadFinished reports the result"""
+        self.loading = True
+        worker = PlaylistIOWorker(self._read_playlists, filepath)
+        worker.signals.finished.connect(self._on_playlists_read)
+        self._load_worker = worker  # Keep the signals object alive until it reports
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_playlists_read(self, playlists):
+        """Apply playlists read by load_playlists_async"""
+        self.loading = False
+        if playlists is None:
+            self.loadFinished.emit(False)
+            return
+        self._apply_playlists(playlists)
+        self.loadFinished.emit(True)
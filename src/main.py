@@ -1,12 +1,18 @@
+import os
 import sys
+import multiprocessing
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
 from src.ui.main_window import MainWindow
 
 def main():
     app = QApplication(sys.argv)
+    # Scans, metadata, album art and playlist I/O all share Qt's global pool; size it once here
+    QThreadPool.globalInstance().setMaxThreadCount(min(8, (os.cpu_count() or 1) * 2))
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
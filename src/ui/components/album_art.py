@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from PyQt6.QtWidgets import QLabel, QSizePolicy
 from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QBrush, QLinearGradient
 from PyQt6.QtCore import Qt, QSize, QRect
@@ -6,15 +7,22 @@ from PyQt6.QtCore import Qt, QSize, QRect
 class AlbumArtDisplay(QLabel):
     """Custom widget for displaying album art with fallback"""
 
+    # Rendered placeholders shared by every instance: (width, height, dpr) -> QPixmap
+    PLACEHOLDER_CACHE_SIZE = 4
+    _PLACEHOLDERS = OrderedDict()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.setMinimumSize(100, 100)
         self.pixmap = None
         self.default_art = True
+        self._scaled_cache = None  # self.pixmap scaled to _scaled_for_size
+        self._scaled_for_size = None
 
     def set_album_art(self, pixmap):
         """Set album art pixmap"""
+        self._scaled_cache = None
         if pixmap and not pixmap.isNull():
             self.pixmap = pixmap
             self.default_art = False
@@ -37,60 +45,90 @@ class AlbumArtDisplay(QLabel):
         painter.drawRect(0, 0, self.width() - 1, self.height() - 1)
 
         if self.pixmap and not self.default_art:
-            # Draw scaled pixmap
-            scaled_pixmap = self.pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            # Draw scaled pixmap, rescaling only after the art or the size changed
+            if self._scaled_cache is None or self._scaled_for_size != self.size():
+                self._scaled_cache = self.pixmap.scaled(
+                    self.size(),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                self._scaled_for_size = self.size()
+            scaled_pixmap = self._scaled_cache
 
             # Center the pixmap
             x = (self.width() - scaled_pixmap.width()) // 2
             y = (self.height() - scaled_pixmap.height()) // 2
             painter.drawPixmap(x, y, scaled_pixmap)
         else:
-            # Draw default placeholder
-            painter.setPen(Qt.PenStyle.NoPen)
-
-            # Draw gradient background
-            gradient = QLinearGradient(0, 0, self.width(), self.height())
-            gradient.setColorAt(0, QColor("#333333"))
-            gradient.setColorAt(1, QColor("#222222"))
-            painter.setBrush(QBrush(gradient))
-            painter.drawRect(0, 0, self.width(), self.height())
-
-            # Draw music note icon
-            painter.setPen(QPen(QColor("#1db954"), 2))
-
-            # Draw a simple music note
-            center_x = self.width() // 2
-            center_y = self.height() // 2
-            note_width = min(self.width(), self.height()) // 3
-
-            # Note head
-            painter.setBrush(QBrush(QColor("#1db954")))
-            painter.drawEllipse(
-                center_x - note_width // 4,
-                center_y + note_width // 2,
-                note_width // 2,
-                note_width // 3
-            )
-
-            # Note stem
-            painter.drawLine(
-                center_x + note_width // 4,
-                center_y - note_width // 2,
-                center_x + note_width // 4,
-                center_y + note_width // 2
-            )
-
-            # Flag
-            painter.drawLine(
-                center_x + note_width // 4,
-                center_y - note_width // 2,
-                center_x + note_width // 2,
-                center_y - note_width // 3
-            )
+            # Draw default placeholder, rendered once per size
+            painter.drawPixmap(0, 0, self._placeholder(self.width(), self.height(),
+                                                       self.devicePixelRatioF()))
+
+    @classmethod
+    def _placeholder(cls, width, height, ratio):
+        """Placeholder art for a size, from the shared cache when possible"""
+        key = (width, height, ratio)
+        pixmap = cls._PLACEHOLDERS.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap(round(width * ratio), round(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        # Draw gradient background
+        gradient = QLinearGradient(0, 0, width, height)
+        gradient.setColorAt(0, QColor("#333333"))
+        gradient.setColorAt(1, QColor("#222222"))
+        painter.setBrush(QBrush(gradient))
+        painter.drawRect(0, 0, width, height)
+
+        # Draw music note icon
+        painter.setPen(QPen(QColor("#1db954"), 2))
+
+        # Draw a simple music note
+        center_x = width // 2
+        center_y = height // 2
+        note_width = min(width, height) // 3
+
+        # Note head
+        painter.setBrush(QBrush(QColor("#1db954")))
+        painter.drawEllipse(
+            center_x - note_width // 4,
+            center_y + note_width // 2,
+            note_width // 2,
+            note_width // 3
+        )
+
+        # Note stem
+        painter.drawLine(
+            center_x + note_width // 4,
+            center_y - note_width // 2,
+            center_x + note_width // 4,
+            center_y + note_width // 2
+        )
+
+        # Flag
+        painter.drawLine(
+            center_x + note_width // 4,
+            center_y - note_width // 2,
+            center_x + note_width // 2,
+            center_y - note_width // 3
+        )
+        painter.end()
+
+        cls._PLACEHOLDERS[key] = pixmap
+        if len(cls._PLACEHOLDERS) > cls.PLACEHOLDER_CACHE_SIZE:
+            cls._PLACEHOLDERS.popitem(last=False)
+        return pixmap
+
+    def resizeEvent(self, event):
+        """Drop the scaled art; it is rebuilt for the new size on the next paint"""
+        self._scaled_cache = None
+        super().resizeEvent(event)
 
     def sizeHint(self):
         """Default size hint"""
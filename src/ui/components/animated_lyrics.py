@@ -1,6 +1,130 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QScrollArea
+import bisect
+from PyQt6.QtWidgets import QWidget, QScrollArea
 from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect
-from PyQt6.QtGui import QColor, QPalette, QFont
+from PyQt6.QtGui import QColor, QPalette, QFont, QFontMetrics, QPainter, QStaticText, QTransform
+
+
+class _LyricsCanvas(QWidget):
+    """Paints all lyric lines itself instead of holding one QLabel per line.
+
+    Only line heights are measured up front; the QStaticText for a line is built
+    the first time that line is painted, so long lyrics cost little until scrolled to.
+    """
+
+    SPACING = 12  # Space between lines
+    MARGIN = 9
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont()
+        self._font.setPixelSize(14)
+        self._active_font = QFont()
+        self._active_font.setPixelSize(16)
+        self._active_font.setBold(True)
+        self._color = QColor(255, 255, 255, 160)
+        self._active_color = QColor("white")
+        self._placeholder_color = QColor(255, 255, 255, 120)
+        self._active_metrics = QFontMetrics(self._active_font)
+
+        self._lines = []  # Line texts
+        self._static = {}  # line index -> (normal, highlighted) QStaticText, built on first paint
+        self._y_offsets = []
+        self._heights = []
+        self._placeholder = None
+        self._active = -1
+        self._layout_width = -1
+
+    def set_lines(self, texts, placeholder=None):
+        """Replace the lines; placeholder is shown centered when there are none"""
+        self._lines = list(texts)
+        self._placeholder = placeholder
+        self._active = -1
+        self._layout_width = -1
+        self._relayout()
+        self.update()
+
+    def set_active(self, index):
+        """Highlight a line, repainting only the lines that change"""
+        if index == self._active:
+            return
+        for old in (self._active, index):
+            if 0 <= old < len(self._lines):
+                self.update(0, self._y_offsets[old], self.width(), self._heights[old])
+        self._active = index
+
+    def line_geometry(self, index):
+        """(y, height) of a line inside the canvas"""
+        return self._y_offsets[index], self._heights[index]
+
+    def _relayout(self):
+        """Wrap lines to the current width and compute where each one goes"""
+        width = self.width()
+        if width == self._layout_width:
+            return
+        self._layout_width = width
+        self._static = {}  # Wrapped for the old width
+        text_width = max(1, width - 2 * self.MARGIN)
+        wrap = Qt.TextFlag.TextWordWrap.value
+
+        self._y_offsets = []
+        self._heights = []
+        y = self.MARGIN
+        for text in self._lines:
+            # Room for the (larger) highlighted version so the lines below never move
+            height = self._active_metrics.boundingRect(0, 0, text_width, 0, wrap, text).height()
+            self._y_offsets.append(y)
+            self._heights.append(height)
+            y += height + self.SPACING
+        self.setMinimumHeight(y - self.SPACING + self.MARGIN if self._lines else 0)
+
+    def _static_texts(self, index):
+        """Prepared (normal, highlighted) static texts for a line"""
+        pair = self._static.get(index)
+        if pair is None:
+            text_width = max(1, self._layout_width - 2 * self.MARGIN)
+            pair = (QStaticText(self._lines[index]), QStaticText(self._lines[index]))
+            for static_text, font in zip(pair, (self._font, self._active_font)):
+                static_text.setTextFormat(Qt.TextFormat.PlainText)
+                static_text.setTextWidth(text_width)
+                static_text.prepare(QTransform(), font)
+            self._static[index] = pair
+        return pair
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._relayout()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+
+        if not self._lines:
+            if self._placeholder:
+                painter.setPen(self._placeholder_color)
+                painter.setFont(self._font)
+                painter.drawText(
+                    self.rect().adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN),
+                    Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+                    self._placeholder
+                )
+            return
+
+        # Only the lines inside the exposed area are drawn
+        top = event.rect().top()
+        bottom = event.rect().bottom()
+        first = max(0, bisect.bisect_right(self._y_offsets, top) - 1)
+        for i in range(first, len(self._lines)):
+            y = self._y_offsets[i]
+            if y > bottom:
+                break
+            normal, highlighted = self._static_texts(i)
+            if i == self._active:
+                painter.setPen(self._active_color)
+                painter.setFont(self._active_font)
+                painter.drawStaticText(self.MARGIN, y, highlighted)
+            else:
+                painter.setPen(self._color)
+                painter.setFont(self._font)
+                painter.drawStaticText(self.MARGIN, y, normal)
 
 
 class AnimatedLyricsDisplay(QScrollArea):
@@ -13,13 +137,10 @@ class AnimatedLyricsDisplay(QScrollArea):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
-        self.lyrics_container = QWidget()
+        # One painted widget holds every line
+        self.lyrics_container = _LyricsCanvas()
         self.setWidget(self.lyrics_container)
 
-        self.layout = QVBoxLayout(self.lyrics_container)
-        self.layout.setSpacing(12)  # Space between lines
-        self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
         # Styling
         self.setStyleSheet(
             "QScrollArea { background-color: transparent; border: none; }"
@@ -28,8 +149,8 @@ class AnimatedLyricsDisplay(QScrollArea):
             "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }"
         )
 
-        self.labels = []  # List of lyric labels
         self.synced_lyrics = []  # List of TimecodedLyric objects
+        self._times = []  # time_ms of each line, for bisecting
         self.current_line_index = -1  # Index of currently highlighted line
         self.scroll_animation = None
 
@@ -39,39 +160,19 @@ class AnimatedLyricsDisplay(QScrollArea):
         self.clear_lyrics()
 
         if not synced_lyrics:
-            # Add a placeholder message
-            label = QLabel("No synced lyrics available")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setWordWrap(True)
-            label.setStyleSheet("color: rgba(255, 255, 255, 120); font-size: 14px;")
-            self.layout.addWidget(label)
-            self.labels.append(label)
+            # Show a placeholder message
+            self.lyrics_container.set_lines([], "No synced lyrics available")
             return
 
         self.synced_lyrics = synced_lyrics
-
-        # Add each line as a label
-        for lyric in synced_lyrics:
-            label = QLabel(lyric.text)
-            label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            label.setWordWrap(True)
-
-            # Default styling (not highlighted)
-            label.setStyleSheet(
-                "color: rgba(255, 255, 255, 160); font-size: 14px;"
-            )
-
-            self.layout.addWidget(label)
-            self.labels.append(label)
+        self._times = [lyric.time_ms for lyric in synced_lyrics]
+        self.lyrics_container.set_lines([lyric.text for lyric in synced_lyrics])
 
     def clear_lyrics(self):
         """Clear all lyrics"""
-        for label in self.labels:
-            self.layout.removeWidget(label)
-            label.deleteLater()
-
-        self.labels = []
+        self.lyrics_container.set_lines([])
         self.synced_lyrics = []
+        self._times = []
         self.current_line_index = -1
 
     def update_position(self, current_ms):
@@ -79,13 +180,8 @@ class AnimatedLyricsDisplay(QScrollArea):
         if not self.synced_lyrics:
             return
 
-        # Find the current line
-        new_index = -1
-        for i, lyric in enumerate(self.synced_lyrics):
-            if lyric.time_ms <= current_ms:
-                new_index = i
-            else:
-                break
+        # Last line starting at or before the current position (lines are in time order)
+        new_index = bisect.bisect_right(self._times, current_ms) - 1
 
         # If line changed, update highlighting
         if new_index != self.current_line_index:
@@ -93,19 +189,11 @@ class AnimatedLyricsDisplay(QScrollArea):
 
     def highlight_line(self, index):
         """Highlight the specified line"""
-        if index < 0 or index >= len(self.labels):
+        if index < 0 or index >= len(self.synced_lyrics):
             return
 
-        # Remove highlight from previous line
-        if 0 <= self.current_line_index < len(self.labels):
-            self.labels[self.current_line_index].setStyleSheet(
-                "color: rgba(255, 255, 255, 160); font-size: 14px;"
-            )
-
-        # Add highlight to new line
-        self.labels[index].setStyleSheet(
-            "color: white; font-size: 16px; font-weight: bold;"
-        )
+        # Only the painted highlight moves; no style sheets are re-parsed
+        self.lyrics_container.set_active(index)
 
         # Store current index
         self.current_line_index = index
@@ -115,16 +203,14 @@ class AnimatedLyricsDisplay(QScrollArea):
 
     def scroll_to_line(self, index):
         """Scroll to make the specified line visible with animation"""
-        if index < 0 or index >= len(self.labels):
+        if index < 0 or index >= len(self.synced_lyrics):
             return
 
-        # Get the position of the target label relative to the scroll area
-        label = self.labels[index]
-        target_y = label.mapTo(self.lyrics_container, QRect(0, 0, 0, 0).topLeft()).y()
+        # Position of the target line inside the lyrics canvas
+        target_y, label_height = self.lyrics_container.line_geometry(index)
 
         # Calculate scroll position to center the line
         viewport_height = self.viewport().height()
-        label_height = label.height()
         scroll_pos = max(0, target_y - (viewport_height / 2) + (label_height / 2))
 
         # Create smooth scrolling animation
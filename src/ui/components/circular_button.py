@@ -1,34 +1,73 @@
 from PyQt6.QtWidgets import QPushButton
-from PyQt6.QtGui import QPainter, QColor, QBrush, QPen, QFont
+from PyQt6.QtGui import QPainter, QColor, QBrush, QPen, QFont, QPixmap
 from PyQt6.QtCore import Qt
 
 class CircularButton(QPushButton):
     """Custom circular button with better styling"""
 
+    # Paint resources shared by every button
+    _BRUSH_NORMAL = QBrush(QColor("#1db954"))
+    _BRUSH_HOVER = QBrush(QColor("#1ed760"))
+    _BRUSH_PRESSED = QBrush(QColor("#1aa34a"))
+    _WHITE_PEN = QPen(QColor("white"))
+    _FONTS = {}  # point size -> QFont, filled on first paint once the app exists
+    # (text, size, device pixel ratio) -> (normal, hover, pressed) pixmaps
+    _PIXMAPS = {}
+
     def __init__(self, text="", size=56):
         super().__init__(text)
         self.setFixedSize(size, size)
         self.size = size
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    @classmethod
+    def _font(cls, point_size):
+        font = cls._FONTS.get(point_size)
+        if font is None:
+            font = cls._FONTS[point_size] = QFont("Arial", point_size, QFont.Weight.Bold)
+        return font
+
+    def _state_pixmaps(self):
+        """The three rendered states for this button's text and size"""
+        ratio = self.devicePixelRatioF()
+        key = (self.text(), self.size, ratio)
+        pixmaps = self._PIXMAPS.get(key)
+        if pixmaps is None:
+            pixmaps = self._PIXMAPS[key] = tuple(
+                self._render(brush, ratio)
+                for brush in (self._BRUSH_NORMAL, self._BRUSH_HOVER, self._BRUSH_PRESSED)
+            )
+        return pixmaps
+
+    def _render(self, brush, ratio):
+        """Draw the button once with the given background into a pixmap"""
+        pixmap = QPixmap(round(self.size * ratio), round(self.size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Button background
-        if self.isDown():
-            color = QColor("#1aa34a")
-        elif self.underMouse():
-            color = QColor("#1ed760")
-        else:
-            color = QColor("#1db954")
-
-        painter.setBrush(QBrush(color))
+        painter.setBrush(brush)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(0, 0, self.size, self.size)
 
         # Button text/icon
-        painter.setPen(QPen(QColor("white")))
-        font = QFont("Arial", 16 if self.size > 40 else 12, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.text())
\ No newline at end of file
+        painter.setPen(self._WHITE_PEN)
+        painter.setFont(self._font(16 if self.size > 40 else 12))
+        painter.drawText(0, 0, self.size, self.size, Qt.AlignmentFlag.AlignCenter, self.text())
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        normal, hover, pressed = self._state_pixmaps()
+        if self.isDown():
+            pixmap = pressed
+        elif self.underMouse():
+            pixmap = hover
+        else:
+            pixmap = normal
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import QSlider
-from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtCore import Qt, QEvent, QTimer
 
 
 class CustomSlider(QSlider):
@@ -9,6 +9,13 @@ class CustomSlider(QSlider):
         super().__init__(orientation)
         self.setMouseTracking(True)
         self.hovering = False
+
+        # Coalesce hover repaints to about one per frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self.update)
+
         self.setStyleSheet("""
             QSlider::groove:horizontal {
                 border: 1px solid #999999;
@@ -36,10 +43,10 @@ class CustomSlider(QSlider):
 
     def enterEvent(self, event):
         self.hovering = True
-        self.update()
+        self._update_timer.start()
         return super().enterEvent(event)
 
     def leaveEvent(self, event):
         self.hovering = False
-        self.update()
+        self._update_timer.start()
         return super().leaveEvent(event)
\ No newline at end of file
@@ -524,7 +524,11 @@ class FullscreenPlayer(QWidget):
             self.current_track_path = file_path
 
             if not metadata and file_path:
-                metadata = self.metadata_handler.extract_metadata(file_path)
+                if pixmap:
+                    metadata = self.metadata_handler.extract_metadata(file_path)
+                else:
+                    # Tags and art come from a single read of the file
+                    metadata, pixmap = self.metadata_handler.extract_all(file_path)
 
             if not metadata:
                 metadata = {
@@ -18,6 +18,7 @@ class LibraryView(QWidget):
         super().__init__()
         self.library_manager = library_manager
         self.metadata_handler = metadata_handler
+        self._populate_generation = 0  # Bumped per refresh so stale results are ignored
         self.init_ui()
         self.setup_connections()
 
@@ -99,18 +100,33 @@ class LibraryView(QWidget):
 
     def populate_library(self):
         """Populate the library table with tracks"""
+        # Get library tracks
+        tracks = list(self.library_manager.get_library())
+
+        # Read every track's tags in one parallel pass off the GUI thread; the table
+        # is filled when the results arrive
+        self._populate_generation += 1
+        generation = self._populate_generation
+        self.metadata_handler.extract_metadata_bulk_async(
+            tracks,
+            lambda metadata_by_track: self._fill_library(generation, tracks, metadata_by_track),
+            stats=self.library_manager.take_scan_stats()
+        )
+
+    def _fill_library(self, generation, tracks, metadata_by_track):
+        """Fill the table with metadata read by populate_library"""
+        if generation != self._populate_generation:
+            return  # A newer refresh is on its way
+
         # Clear table
         self.library_table.setRowCount(0)
 
-        # Get library tracks
-        tracks = self.library_manager.get_library()
-
         # Filter if search is active
         search_text = self.search_input.text().lower()
         if search_text:
             filtered_tracks = []
             for track in tracks:
-                metadata = self.metadata_handler.extract_metadata(track)
+                metadata = metadata_by_track[track]
                 if (search_text in metadata['title'].lower() or
                         search_text in metadata['artist'].lower() or
                         search_text in metadata['album'].lower()):
@@ -121,7 +137,7 @@ class LibraryView(QWidget):
         self.library_table.setSortingEnabled(False)  # Disable sorting while updating
 
         for track in tracks:
-            metadata = self.metadata_handler.extract_metadata(track)
+            metadata = metadata_by_track[track]
 
             # Create new row
             row = self.library_table.rowCount()
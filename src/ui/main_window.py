@@ -1,4 +1,5 @@
 import os
+import functools
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QSplitter, QMessageBox, QFileDialog, QLabel
@@ -20,6 +21,19 @@ from src.utils.audio_effects import AudioEffects
 from src.utils.constants import APP_NAME, DEFAULT_STYLES
 
 
+@functools.lru_cache(maxsize=None)
+def _load_stylesheet():
+    """Read the dark theme once, falling back to the built-in styles"""
+    try:
+        style_path = os.path.join("resources", "styles", "dark_theme.qss")
+        if os.path.exists(style_path):
+            with open(style_path, 'r') as f:
+                return f.read()
+    except Exception as e:
+        print(f"Error loading stylesheet: {e}")
+    return DEFAULT_STYLES
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
 
@@ -38,8 +52,8 @@ class MainWindow(QMainWindow):
         self.setGeometry(200, 100, 1000, 700)
         self.setMinimumSize(800, 600)
 
-        # Apply styling
-        self.setStyleSheet(DEFAULT_STYLES)
+        # Apply styling once, before child widgets are created and polished
+        self.setStyleSheet(_load_stylesheet())
 
         # Initialize UI components
         self._init_ui()
@@ -97,17 +111,6 @@ class MainWindow(QMainWindow):
 
         # Setup menu bar
         self._setup_menu_bar()
-        try:
-            style_path = os.path.join("resources", "styles", "dark_theme.qss")
-            if os.path.exists(style_path):
-                with open(style_path, 'r') as f:
-                    self.setStyleSheet(f.read())
-            else:
-                # Fall back to built-in styles
-                self.setStyleSheet(DEFAULT_STYLES)
-        except Exception as e:
-            print(f"Error loading stylesheet: {e}")
-            self.setStyleSheet(DEFAULT_STYLES)
 
     def _setup_menu_bar(self):
         """Setup application menu bar"""
@@ -243,11 +246,10 @@ class MainWindow(QMainWindow):
         else:
             self.player_controls.set_playing_state(False)
 
-        # Update window title with current track
+        # Update window title with current track (once its metadata has arrived)
         if state in ('playing', 'paused'):
-            current_track = self.playlist_manager.get_current_track()
-            if current_track:
-                metadata = self.metadata_handler.extract_metadata(current_track)
+            metadata = self.player_controls.current_metadata
+            if metadata and metadata.get('path') == self.player.current_media:
                 self.setWindowTitle(f"{metadata['title']} - {metadata['artist']} | {APP_NAME}")
         else:
             self.setWindowTitle(APP_NAME)
@@ -266,15 +268,33 @@ class MainWindow(QMainWindow):
         if self.player.load_media(file_path):
             self.player.play()
 
-            # Update UI with track info
-            metadata = self.metadata_handler.extract_metadata(file_path)
-            self.player_controls.update_track_info(metadata)
+            # Read track info in the background; the UI updates when it arrives
+            self.metadata_handler.extract_metadata_async(file_path, self._on_track_metadata)
+
+            # Album art is decoded in the background as well
+            self.metadata_handler.extract_album_art_async(file_path, self._on_track_album_art)
 
-            # Load album art
-            album_art = self.metadata_handler.extract_album_art(file_path)
-            self.player_controls.update_album_art(album_art)
+            # Parse the following track now so skipping to it doesn't stall
+            next_track = self.playlist_manager.peek_next_track()
+            if next_track and next_track != file_path:
+                self.player.preload(next_track)
         self.player_controls.current_track_path = file_path
 
+    def _on_track_metadata(self, file_path, metadata):
+        """Apply metadata extracted in the background for the playing track"""
+        if file_path != self.player.current_media:
+            return  # Another track was started in the meantime
+
+        self.player_controls.update_track_info(metadata)
+        self.setWindowTitle(f"{metadata['title']} - {metadata['artist']} | {APP_NAME}")
+
+    def _on_track_album_art(self, file_path, pixmap):
+        """Show album art decoded in the background for the playing track"""
+        if file_path != self.player.current_media:
+            return  # Another track was started in the meantime
+
+        self.player_controls.update_album_art(pixmap)
+
     def _toggle_playback(self):
         """Toggle play/pause state"""
         if self.player.is_playing():
@@ -321,10 +341,7 @@ class MainWindow(QMainWindow):
                     self._play_track(file_paths[0])
 
             # Update library with these files
-            for file in file_paths:
-                if file not in self.library_manager.library:
-                    self.library_manager.library.append(file)
-            self.library_manager.libraryUpdated.emit()
+            self.library_manager.add_files(file_paths)
 
     def _open_folder(self):
         """Open folder dialog to add all audio files"""
@@ -368,8 +385,8 @@ class MainWindow(QMainWindow):
         if geometry:
             self.restoreGeometry(geometry)
 
-        # Load playlists
-        self.playlist_manager.load_playlists()
+        # Load playlists in the background; the views fill in as playlistChanged arrives
+        self.playlist_manager.load_playlists_async()
 
         # Load library
         self.library_manager.load_library()
@@ -381,7 +398,7 @@ class MainWindow(QMainWindow):
         # Window geometry
         settings.setValue("geometry", self.saveGeometry())
 
-        # Save playlists
+        # Save playlists (skipped if the startup load hasn't finished, so the file is kept)
         self.playlist_manager.save_playlists()
 
         # Save library
@@ -394,5 +411,6 @@ class MainWindow(QMainWindow):
 
         # Save settings
         self._save_settings()
+        self.metadata_handler.close()
 
         event.accept()
@@ -157,10 +157,18 @@ class PlayerControls(QWidget):
     def update_position(self, current_ms, total_ms):
         """Update position slider and time labels"""
         if not self.is_slider_pressed and total_ms > 0:
+            # Only touch widgets whose displayed value actually changed
             position = int((current_ms / total_ms) * 1000)
-            self.progress_slider.setValue(position)
-            self.current_time_label.setText(self.format_time(current_ms))
-            self.total_time_label.setText(self.format_time(total_ms))
+            if position != self.progress_slider.value():
+                self.progress_slider.setValue(position)
+
+            current_str = self.format_time(current_ms)
+            if current_str != self.current_time_label.text():
+                self.current_time_label.setText(current_str)
+
+            total_str = self.format_time(total_ms)
+            if total_str != self.total_time_label.text():
+                self.total_time_label.setText(total_str)
 
     def slider_pressed(self):
         """Handle slider press event"""
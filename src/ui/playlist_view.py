@@ -131,6 +131,12 @@ class PlaylistView(QWidget):
 
     def on_current_track_changed(self, track_index, track_path):
         """Handle current track change"""
+        # Rows mirror the playlist order, so try the reported index first
+        item = self.tracks_list.item(track_index)
+        if item is not None and item.data(Qt.ItemDataRole.UserRole) == track_path:
+            self.tracks_list.setCurrentItem(item)
+            return
+
         # Highlight the current track in the list
         for i in range(self.tracks_list.count()):
             item = self.tracks_list.item(i)
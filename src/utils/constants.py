@@ -7,11 +7,7 @@ APP_VERSION = "1.0.0"
 # Default styling
 DEFAULT_STYLES = """
     QMainWindow {
-        background: qlineargradient(
-            x1:0, y1:0, x2:0, y2:1,
-            stop:0 #191414,
-            stop:1 #121212
-        );
+        background-color: #141414;
         color: #ffffff;
     }
 